@@ -0,0 +1,79 @@
+# Retained background: a copy of the static part of a screen (frames,
+# logos, labels), composed once and restored before drawing the values
+# that change, e.g.
+#   epd.draw_bmp(frame_buffer_black, '/flash/chrome.bmp', COLORED)
+#   background = Background(epd, frame_buffer_black, frame_buffer_red)
+#   ...
+#   background.restore_rect(frame_buffer_black, frame_buffer_red, 10, 40, 189, 71)
+#   epd.display_string_at(frame_buffer_black, 10, 40, value, font, COLORED)
+#   epd.display_frame(frame_buffer_black, frame_buffer_red)
+# Restoring copies bytes and marks only what it restored as changed.
+# Snapshots hold the buffers as laid out when taken: take them again
+# after set_rotate or set_logical_buffers.
+class Background:
+    def __init__(self, epd, frame_buffer_black, frame_buffer_red=None):
+        self.epd = epd
+        self.black = bytearray(frame_buffer_black)
+        self.red = None
+        self.snapshot(frame_buffer_black, frame_buffer_red)
+
+    # Takes the planes again, into the buffers of the first snapshot
+    def snapshot(self, frame_buffer_black, frame_buffer_red=None):
+        self.black[:] = frame_buffer_black
+        if frame_buffer_red is None:
+            self.red = None
+        elif self.red is None:
+            self.red = bytearray(frame_buffer_red)
+        else:
+            self.red[:] = frame_buffer_red
+        self._layout = (self.epd.rotate, self.epd.logical_buffers)
+
+    # Restores the whole planes. Planes without a snapshot are left as they are.
+    def restore(self, frame_buffer_black, frame_buffer_red=None):
+        frame_buffer_black[:] = self.black
+        if frame_buffer_red is not None and self.red is not None:
+            frame_buffer_red[:] = self.red
+        self.epd.mark_dirty()
+
+    # Restores the rectangle from (x0, y0) to (x1, y1), in current orientation
+    # coordinates. Whole bytes are copied as slices, the pixels sharing the
+    # bytes at the left and right edges are kept.
+    def restore_rect(self, frame_buffer_black, frame_buffer_red, x0, y0, x1, y1):
+        epd = self.epd
+        if (epd.rotate, epd.logical_buffers) != self._layout:
+            raise ValueError('buffer layout changed since the snapshot')
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, epd.width - 1)
+        y1 = min(y1, epd.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        epd.mark_dirty(x0, y0, x1, y1)
+        x0, y0, x1, y1 = epd._buffer_rect(x0, y0, x1, y1)
+        stride = epd.buffer_width // 8
+        self._restore_rows(frame_buffer_black, self.black, stride, x0, y0, x1, y1)
+        if frame_buffer_red is not None and self.red is not None:
+            self._restore_rows(frame_buffer_red, self.red, stride, x0, y0, x1, y1)
+
+    def _restore_rows(self, frame_buffer, saved, stride, x0, y0, x1, y1):
+        saved = memoryview(saved)
+        if x0 == 0 and x1 == stride * 8 - 1:
+            frame_buffer[y0 * stride:(y1 + 1) * stride] = saved[y0 * stride:(y1 + 1) * stride]
+            return
+        first = x0 >> 3
+        last = x1 >> 3
+        first_mask = 0xFF >> (x0 & 7)
+        last_mask = (0xFF00 >> ((x1 & 7) + 1)) & 0xFF
+        if first == last:
+            first_mask &= last_mask
+        for y in range(y0, y1 + 1):
+            start = y * stride + first
+            end = y * stride + last
+            frame_buffer[start] = (frame_buffer[start] & ~first_mask & 0xFF) | (saved[start] & first_mask)
+            if end > start:
+                frame_buffer[start + 1:end] = saved[start + 1:end]
+                frame_buffer[end] = (frame_buffer[end] & ~last_mask & 0xFF) | (saved[end] & last_mask)
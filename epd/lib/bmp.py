@@ -23,22 +23,33 @@ class BitmapHeaderInfo:
             raise ValueError
         if int.from_bytes(bytes[12:14], 'little') != 1:
             raise ValueError # planes
-        if int.from_bytes(bytes[14:16], 'little') != 1:
-            raise ValueError # bit-depth
+        self.bit_depth = int.from_bytes(bytes[14:16], 'little')
+        if self.bit_depth not in (1, 8, 24):
+            raise ValueError # bit-depth: 1 bit, 8 bit palette or 24 bit color
         if int.from_bytes(bytes[16:20], 'little') != 0:
             raise ValueError # compression
-        if int.from_bytes(bytes[32:36], 'little') > 1:
-            raise ValueError # we accept at most 1 color
-        if int.from_bytes(bytes[36:40], 'little') > 1:
-            raise ValueError # we accept at most 1 significant color
-
+        self.colors = int.from_bytes(bytes[32:36], 'little')
+        if self.bit_depth == 1:
+            if self.colors > 1:
+                raise ValueError # we accept at most 1 color
+            if int.from_bytes(bytes[36:40], 'little') > 1:
+                raise ValueError # we accept at most 1 significant color
+        elif self.bit_depth == 8:
+            if self.colors > 256:
+                raise ValueError
+            if self.colors == 0:
+                self.colors = 256
+
+        # the palette follows the header, which can be longer than this part
+        self.header_size = int.from_bytes(bytes[0:4], 'little')
         self.width = int.from_bytes(bytes[4:8], 'little')
         self.height = int.from_bytes(bytes[8:12], 'little')
 
         self.width_in_bytes = int((self.width+7)/8)
         padding = (4 - int(self.width_in_bytes % 4)) % 4
 
-        self.line_width = self.width_in_bytes + padding
+        # rows are padded to 4 bytes
+        self.line_width = (self.width * self.bit_depth + 31) // 32 * 4
         self.width_padding = (self.width_in_bytes + padding) * 8 - self.width
         self.last_byte_padding = self.width_in_bytes * 8 - self.width
 
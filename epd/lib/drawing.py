@@ -0,0 +1,1488 @@
+import os
+
+from bmp import BitmapHeader, BitmapHeaderInfo
+from packbits import PackedPlane
+
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
+
+# Color or no color
+COLORED = 1
+UNCOLORED = 0
+
+# Display orientation
+ROTATE_0                                    = 0
+ROTATE_90                                   = 1
+ROTATE_180                                  = 2
+ROTATE_270                                  = 3
+
+# BMP rows are read up to this many bytes at a time
+BMP_READ_SIZE = 512
+# Headers of this many BMP files are kept, by path, size and modification
+# time
+BMP_HEADER_CACHE = 4
+# Color BMPs: gray level (0-255) below which pixels are black, and how much
+# the red component has to exceed green and blue for a pixel to be red
+BMP_THRESHOLD = 128
+BMP_RED_MARGIN = 64
+
+
+def union_rect(rect, x0, y0, x1, y1):
+    if rect is None:
+        return [x0, y0, x1, y1]
+    if x0 < rect[0]:
+        rect[0] = x0
+    if y0 < rect[1]:
+        rect[1] = y0
+    if x1 > rect[2]:
+        rect[2] = x1
+    if y1 > rect[3]:
+        rect[3] = y1
+    return rect
+
+
+# Cohen-Sutherland outcodes, where a point lies around a rectangle. Lines
+# whose end points have a bit in common lie outside of it, lines whose end
+# points both have none lie inside of it.
+_LEFT = 1
+_RIGHT = 2
+_TOP = 4
+_BOTTOM = 8
+
+
+def _outcode(x, y, x0, y0, x1, y1):
+    code = 0
+    if x < x0:
+        code = _LEFT
+    elif x > x1:
+        code = _RIGHT
+    if y < y0:
+        code |= _TOP
+    elif y > y1:
+        code |= _BOTTOM
+    return code
+
+
+# Offsets along a line going from a to b whose coordinate is within low..high
+def _axis_range(a, b, low, high):
+    if b >= a:
+        return low - a, high - a
+    return a - high, a - low
+
+
+# n / d rounded to the nearest integer, halves away from zero
+def _div_round(n, d):
+    if d < 0:
+        n = -n
+        d = -d
+    if n < 0:
+        return -((-2 * n + d) // (2 * d))
+    return (2 * n + d) // (2 * d)
+
+
+# Integer square root of n, rounded down, by Newton's method from guess,
+# which must not be below the root
+def _isqrt(n, guess=0):
+    if n <= 0:
+        return 0
+    x = guess if guess > 0 else n
+    while True:
+        y = (x + n // x) >> 1
+        if y >= x:
+            return x
+        x = y
+
+
+# Half width of the row dy rows from the center of an ellipse with radii
+# rx and ry, rounded, guess as in _isqrt for twice the width
+def _ellipse_width(rx, ry, dy, guess=0):
+    if ry == 0:
+        return rx
+    return (_isqrt(4 * rx * rx * (ry * ry - dy * dy) // (ry * ry), guess) + 1) >> 1
+
+
+# Half widths of the rows of a circle, from the middle row out, as the
+# Bresenham algorithm of draw_circle takes them
+def _circle_widths(radius):
+    widths = []
+    x_pos = -radius
+    y_pos = 0
+    err = 2 - 2 * radius
+    while True:
+        if len(widths) == y_pos:
+            widths.append(-x_pos)
+        e2 = err
+        if (e2 <= y_pos):
+            y_pos += 1
+            err += y_pos * 2 + 1
+            if(-x_pos == y_pos and e2 <= x_pos):
+                e2 = 0
+        if (e2 > x_pos):
+            x_pos += 1
+            err += x_pos * 2 + 1
+        if x_pos > 0:
+            return widths
+
+
+# Half widths of the rows of an ellipse from the middle row out, each
+# bounding the next. Circles are taken as draw_circle draws them.
+def _ellipse_widths(rx, ry):
+    if rx == ry:
+        return _circle_widths(rx)
+    widths = [rx]
+    for dy in range(1, ry + 1):
+        widths.append(_ellipse_width(rx, ry, dy, 2 * widths[-1] + 2))
+    return widths
+
+
+# Half width of the inside of the outline draw_circle draws, dy rows from
+# the center, given the half widths of the circle; -1 if there's none
+def _circle_inside(widths, dy):
+    outer = widths[dy + 1] if dy + 1 < len(widths) else -1
+    return min(outer, widths[dy] - 1)
+
+
+# sin of 0 to 90 degrees, times 4096
+_SIN_TABLE = (
+    0, 71, 143, 214, 286, 357, 428, 499, 570, 641, 711, 782, 852, 921, 991,
+    1060, 1129, 1198, 1266, 1334, 1401, 1468, 1534, 1600, 1666, 1731, 1796,
+    1860, 1923, 1986, 2048, 2110, 2171, 2231, 2290, 2349, 2408, 2465, 2522,
+    2578, 2633, 2687, 2741, 2793, 2845, 2896, 2946, 2996, 3044, 3091, 3138,
+    3183, 3228, 3271, 3314, 3355, 3396, 3435, 3474, 3511, 3547, 3582, 3617,
+    3650, 3681, 3712, 3742, 3770, 3798, 3824, 3849, 3873, 3896, 3917, 3937,
+    3956, 3974, 3991, 4006, 4021, 4034, 4046, 4056, 4065, 4074, 4080, 4086,
+    4090, 4094, 4095, 4096)
+
+
+# Direction of angle degrees as (cos, sin) times 4096
+def _direction(angle):
+    angle %= 360
+    if angle <= 90:
+        return _SIN_TABLE[90 - angle], _SIN_TABLE[angle]
+    if angle <= 180:
+        return -_SIN_TABLE[angle - 90], _SIN_TABLE[180 - angle]
+    if angle <= 270:
+        return -_SIN_TABLE[270 - angle], -_SIN_TABLE[angle - 180]
+    return _SIN_TABLE[angle - 270], -_SIN_TABLE[360 - angle]
+
+
+# Leftmost and rightmost pixels on row y of the line drawn from (ax, ay) to
+# (bx, by), rounded as in Drawing._line_point. The line must cross row y,
+# and not be horizontal.
+def _line_row(ax, ay, bx, by, y):
+    dx = abs(bx - ax)
+    dy = abs(by - ay)
+    m = abs(y - ay)
+    if dy > dx:
+        minor = (2 * m * dx + dy) // (2 * dy)
+        x = ax + minor if bx > ax else ax - minor
+        return x, x
+    # steps whose minor offset rounds to m
+    first = max(0, -(((1 - 2 * m) * dx) // (2 * dy)))
+    last = min(dx, -((-(2 * m + 1) * dx) // (2 * dy)) - 1)
+    if bx >= ax:
+        return ax + first, ax + last
+    return ax - last, ax - first
+
+
+# Offsets dx with dx * a <= b, as an inclusive range
+def _half_line(a, b, low, high):
+    if a > 0:
+        return low, b // a
+    if a < 0:
+        return -(b // -a), high
+    if b >= 0:
+        return low, high
+    return high, low
+
+
+# Bits of every byte in reverse order, for mirroring rows
+def _build_reverse_table():
+    table = bytearray(256)
+    for byte in range(256):
+        for bit in range(8):
+            if byte & (1 << bit):
+                table[byte] |= 0x80 >> bit
+    return bytes(table)
+
+REVERSE_TABLE = _build_reverse_table()
+
+
+# Transposes an 8x8 block of pixels in place: bit 7 - x of block[y] is
+# swapped with bit 7 - y of block[x]. Swaps the off-diagonal 4x4 quarters,
+# then the 2x2 and 1x1 ones inside of them.
+def transpose8(block):
+    for i in (0, 1, 2, 3):
+        a = block[i]
+        b = block[i + 4]
+        block[i] = (a & 0xF0) | (b >> 4)
+        block[i + 4] = ((a << 4) & 0xF0) | (b & 0x0F)
+    for i in (0, 1, 4, 5):
+        a = block[i]
+        b = block[i + 2]
+        block[i] = (a & 0xCC) | ((b >> 2) & 0x33)
+        block[i + 2] = ((a << 2) & 0xCC) | (b & 0x33)
+    for i in (0, 2, 4, 6):
+        a = block[i]
+        b = block[i + 1]
+        block[i] = (a & 0xAA) | ((b >> 1) & 0x55)
+        block[i + 1] = ((a << 1) & 0xAA) | (b & 0x55)
+
+
+# Glyph of char as (data, offset, width): font.height rows of (width + 7) // 8
+# bytes starting at data[offset], most significant bit first, set bits drawn.
+# Fonts may provide it with a glyph(char) function. Otherwise they hold the
+# glyphs for the characters from ' ' on in font.data, all font.width wide,
+# or, in proportional fonts made by tools/fontcompile.py, from font.first on
+# with their widths in font.widths and positions in font.offsets.
+def font_glyph(font, char):
+    glyph = getattr(font, 'glyph', None)
+    if glyph is not None:
+        return glyph(char)
+    widths = getattr(font, 'widths', None)
+    if widths is not None:
+        index = _glyph_index(font, widths, char)
+        offsets = font.offsets
+        return font.data, offsets[2 * index] | (offsets[2 * index + 1] << 8), widths[index]
+    return font.data, (ord(char) - ord(' ')) * font.height * ((font.width + 7) // 8), font.width
+
+
+# Horizontal advance of char in pixels, see font_glyph. Fonts may also
+# provide it with an advance(char) function.
+def char_width(font, char):
+    advance = getattr(font, 'advance', None)
+    if advance is not None:
+        return advance(char)
+    widths = getattr(font, 'widths', None)
+    if widths is not None:
+        return widths[_glyph_index(font, widths, char)]
+    return font.width
+
+
+# Characters missing from proportional fonts are drawn as the first one
+def _glyph_index(font, widths, char):
+    index = ord(char) - font.first
+    if index < 0 or index >= len(widths):
+        return 0
+    return index
+
+
+def _gray(red, green, blue):
+    return (red * 77 + green * 150 + blue * 29) >> 8
+
+
+def _is_red(red, green, blue):
+    return red - max(green, blue) >= BMP_RED_MARGIN
+
+
+# Drawing functions shared by all panel drivers. Frame buffers hold 1 bit per
+# pixel, rows of WIDTH pixels, most significant bit first, 0 meaning colored.
+# Subclasses define the panel resolution in WIDTH and HEIGHT.
+# With set_logical_buffers(True) buffers hold the image as seen in the current
+# orientation instead, rows of width pixels, and are rotated on transfer.
+class Drawing:
+    WIDTH = 200
+    HEIGHT = 200
+
+    def __init__(self):
+        self.width = self.WIDTH
+        self.height = self.HEIGHT
+        self.rotate = ROTATE_0
+
+        # Layout of the frame buffers, see set_logical_buffers
+        self.logical_buffers = False
+        self.buffer_width = self.WIDTH
+        self.buffer_height = self.HEIGHT
+
+        # Region drawn since the last transfer, in panel coordinates
+        self.dirty = None
+
+        # Rectangle drawing is limited to, see set_clip, and the part of it
+        # within the frame, in current orientation and buffer coordinates
+        self.clip = None
+        self._clip = (0, 0, self.WIDTH - 1, self.HEIGHT - 1)
+        self._buffer_clip = self._clip
+        # buffer column and row offset moves of a step along x and along y
+        self._line_steps = (1, 0, 0, self.WIDTH // 8)
+
+        self.use_framebuf = False
+        self._framebufs = []
+        self._glyph_framebuf = None
+        # turned copies of glyphs, see _draw_bits
+        self._bits = bytearray(0)
+        # rows read from BMP files, and headers of the last files drawn
+        self._bmp_rows = bytearray(0)
+        self._bmp_headers = []
+
+        # rows of colored and uncolored bytes for span fills
+        size = max(self.WIDTH, self.HEIGHT) // 8
+        self._fill_bytes = (memoryview(b'\xff' * size), memoryview(bytes(size)))
+
+    # Delegates drawing to the C implementation of the framebuf module where
+    # possible. Returns False if framebuf is not available in the firmware.
+    def set_framebuf(self, enabled):
+        self.use_framebuf = enabled and framebuf is not None
+        self._framebufs = []
+        self._glyph_framebuf = None
+        return self.use_framebuf
+
+    # FrameBuffer wrapping frame_buffer, or None if drawing on it has to go
+    # through set_pixel. framebuf knows nothing about rotation, so it's only
+    # used on rotated frames with logical buffers.
+    def _framebuf(self, frame_buffer):
+        if not self.use_framebuf or not isinstance(frame_buffer, bytearray):
+            return None
+        if self.rotate != ROTATE_0 and not self.logical_buffers:
+            return None
+        for buffer, fbuf in self._framebufs:
+            if buffer is frame_buffer:
+                return fbuf
+        fbuf = framebuf.FrameBuffer(frame_buffer, self.buffer_width, self.buffer_height, framebuf.MONO_HLSB)
+        # keep the black and the red plane
+        self._framebufs = self._framebufs[-1:] + [(frame_buffer, fbuf)]
+        return fbuf
+
+    # Blits a 1 bit per pixel image whose set bits are drawn, like glyphs and
+    # BMP rows. The source is copied to a scratch FrameBuffer, inverted when
+    # colored, because framebuf can only skip pixels of one color.
+    def _blit_bits(self, fbuf, data, offset, width, height, x, y, colored, stride):
+        row_bytes = (width + 7) // 8
+        scratch = self._glyph_framebuf
+        if scratch is None or scratch[0] != width or scratch[1] != height:
+            buffer = bytearray(row_bytes * height)
+            scratch = (width, height, buffer, framebuf.FrameBuffer(buffer, width, height, framebuf.MONO_HLSB))
+            self._glyph_framebuf = scratch
+        buffer = scratch[2]
+        pos = 0
+        for row in range(height):
+            src = offset + row * stride
+            if colored:
+                for i in range(row_bytes):
+                    buffer[pos + i] = ~data[src + i] & 0xFF
+            else:
+                for i in range(row_bytes):
+                    buffer[pos + i] = data[src + i]
+            pos += row_bytes
+        fbuf.blit(scratch[3], x, y, 1 if colored else 0)
+
+    def clear_frame(self, frame_buffer_black, frame_buffer_red=None):
+        self.mark_absolute_dirty(0, 0, self.WIDTH - 1, self.HEIGHT - 1)
+        self._fill_absolute_rect(frame_buffer_black, 0, 0, self.buffer_width - 1, self.buffer_height - 1, UNCOLORED)
+        if frame_buffer_red is not None:
+            self._fill_absolute_rect(frame_buffer_red, 0, 0, self.buffer_width - 1, self.buffer_height - 1, UNCOLORED)
+
+    # Fills a rectangle given in current orientation coordinates, inclusive.
+    # Pixels outside of the clip rectangle are skipped like in set_pixel.
+    def _fill_rect(self, frame_buffer, x0, y0, x1, y1, colored):
+        rect = self._clip_rect(x0, y0, x1, y1)
+        if rect is not None:
+            self._fill_clipped_rect(frame_buffer, rect[0], rect[1], rect[2], rect[3], colored)
+
+    # Fills a rectangle known to be within the clip rectangle
+    def _fill_clipped_rect(self, frame_buffer, x0, y0, x1, y1, colored):
+        x0, y0, x1, y1 = self._buffer_rect(x0, y0, x1, y1)
+        self._fill_absolute_rect(frame_buffer, x0, y0, x1, y1, colored)
+
+    # Part of a rectangle within the clip rectangle, with sorted corners,
+    # or None if it's outside of it
+    def _clip_rect(self, x0, y0, x1, y1):
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        clip_x0, clip_y0, clip_x1, clip_y1 = self._clip
+        if x0 < clip_x0:
+            x0 = clip_x0
+        if y0 < clip_y0:
+            y0 = clip_y0
+        if x1 > clip_x1:
+            x1 = clip_x1
+        if y1 > clip_y1:
+            y1 = clip_y1
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, y0, x1, y1
+
+    # Limits drawing to the rectangle from (x0, y0) to (x1, y1), inclusive,
+    # in current orientation coordinates. Drawing functions clip lines and
+    # shapes to it once, then write their pixels unchecked. clear_frame and
+    # set_absolute_pixel ignore it.
+    def set_clip(self, x0, y0, x1, y1):
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        self.clip = (x0, y0, x1, y1)
+        self._update_clip()
+
+    def reset_clip(self):
+        self.clip = None
+        self._update_clip()
+
+    def _update_clip(self):
+        x0, y0, x1, y1 = 0, 0, self.width - 1, self.height - 1
+        if self.clip is not None:
+            x0 = max(x0, self.clip[0])
+            y0 = max(y0, self.clip[1])
+            x1 = min(x1, self.clip[2])
+            y1 = min(y1, self.clip[3])
+        self._clip = (x0, y0, x1, y1)
+        if x0 > x1 or y0 > y1:
+            self._buffer_clip = (0, 0, -1, -1)
+        else:
+            self._buffer_clip = self._buffer_rect(x0, y0, x1, y1)
+
+    # Fills a rectangle given in buffer coordinates, inclusive, a row at a time:
+    # whole bytes in the middle of a row are written at once, and only the
+    # bytes at the edges are masked.
+    def _fill_absolute_rect(self, frame_buffer, x0, y0, x1, y1, colored):
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self.buffer_width - 1)
+        y1 = min(y1, self.buffer_height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        stride = self.buffer_width // 8
+        first = x0 >> 3
+        last = x1 >> 3
+        first_mask = 0xFF >> (x0 & 7)
+        last_mask = (0xFF << (7 - (x1 & 7))) & 0xFF
+        if first == last:
+            first_mask &= last_mask
+        fill = self._fill_bytes[1 if colored else 0]
+        inner = last - first - 1
+        slices = inner > 0 and isinstance(frame_buffer, (bytearray, memoryview))
+        for row in range(y0 * stride, (y1 + 1) * stride, stride):
+            if colored:
+                frame_buffer[row + first] &= ~first_mask
+            else:
+                frame_buffer[row + first] |= first_mask
+            if first == last:
+                continue
+            if slices:
+                frame_buffer[row + first + 1:row + last] = fill[:inner]
+            else:
+                for i in range(row + first + 1, row + last):
+                    frame_buffer[i] = fill[0]
+            if colored:
+                frame_buffer[row + last] &= ~last_mask
+            else:
+                frame_buffer[row + last] |= last_mask
+
+
+    # Marks a region of the frame buffers as changed, in current orientation
+    # coordinates. Drawing primitives do it on their own; call it after
+    # writing to a buffer directly. With no arguments marks the whole frame.
+    def mark_dirty(self, x0=0, y0=0, x1=None, y1=None):
+        if x1 is None:
+            x1 = self.width - 1
+        if y1 is None:
+            y1 = self.height - 1
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        x0, y0, x1, y1 = self._panel_rect(x0, y0, x1, y1)
+        self.mark_absolute_dirty(x0, y0, x1, y1)
+
+    # Maps a rectangle from current orientation to panel coordinates,
+    # the same way set_pixel maps pixels
+    def _panel_rect(self, x0, y0, x1, y1):
+        if (self.rotate == ROTATE_90):
+            return self.WIDTH - 1 - y1, x0, self.WIDTH - 1 - y0, x1
+        elif (self.rotate == ROTATE_180):
+            return self.WIDTH - 1 - x1, self.HEIGHT - 1 - y1, self.WIDTH - 1 - x0, self.HEIGHT - 1 - y0
+        elif (self.rotate == ROTATE_270):
+            return y0, self.HEIGHT - 1 - x1, y1, self.HEIGHT - 1 - x0
+        return x0, y0, x1, y1
+
+    # Maps a rectangle from panel coordinates to current orientation
+    def _logical_rect(self, x0, y0, x1, y1):
+        if (self.rotate == ROTATE_90):
+            return y0, self.WIDTH - 1 - x1, y1, self.WIDTH - 1 - x0
+        elif (self.rotate == ROTATE_180):
+            return self.WIDTH - 1 - x1, self.HEIGHT - 1 - y1, self.WIDTH - 1 - x0, self.HEIGHT - 1 - y0
+        elif (self.rotate == ROTATE_270):
+            return self.HEIGHT - 1 - y1, x0, self.HEIGHT - 1 - y0, x1
+        return x0, y0, x1, y1
+
+    # Maps a rectangle from current orientation to buffer coordinates
+    def _buffer_rect(self, x0, y0, x1, y1):
+        if self.logical_buffers:
+            return x0, y0, x1, y1
+        return self._panel_rect(x0, y0, x1, y1)
+
+    def mark_absolute_dirty(self, x0, y0, x1, y1):
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self.WIDTH - 1)
+        y1 = min(y1, self.HEIGHT - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        self.dirty = union_rect(self.dirty, x0, y0, x1, y1)
+
+
+    def set_rotate(self, rotate):
+        if (rotate == ROTATE_0):
+            self.rotate = ROTATE_0
+            self.width = self.WIDTH
+            self.height = self.HEIGHT
+        elif (rotate == ROTATE_90):
+            self.rotate = ROTATE_90
+            self.width = self.HEIGHT
+            self.height = self.WIDTH
+        elif (rotate == ROTATE_180):
+            self.rotate = ROTATE_180
+            self.width = self.WIDTH
+            self.height = self.HEIGHT
+        elif (rotate == ROTATE_270):
+            self.rotate = ROTATE_270
+            self.width = self.HEIGHT
+            self.height = self.WIDTH
+        self._update_layout()
+
+    # Selects whether frame buffers hold the image in the current orientation
+    # (logical buffers) or as the panel scans it. Drawing on logical buffers
+    # never has to map coordinates, so all fast paths apply in every
+    # orientation, and the rotation is applied once while the frame is sent.
+    # Buffers have to be redrawn after switching, or after set_rotate.
+    # Needs WIDTH and HEIGHT to be multiples of 8.
+    def set_logical_buffers(self, enabled):
+        self.logical_buffers = enabled
+        self._update_layout()
+
+    def _update_layout(self):
+        if self.logical_buffers:
+            self.buffer_width = self.width
+            self.buffer_height = self.height
+        else:
+            self.buffer_width = self.WIDTH
+            self.buffer_height = self.HEIGHT
+        self._framebufs = []
+        self._update_clip()
+        stride = self.buffer_width // 8
+        if self.rotate == ROTATE_0 or self.logical_buffers:
+            self._line_steps = (1, 0, 0, stride)
+        elif self.rotate == ROTATE_90:
+            self._line_steps = (0, stride, -1, 0)
+        elif self.rotate == ROTATE_180:
+            self._line_steps = (-1, 0, 0, -stride)
+        else:
+            self._line_steps = (0, -stride, 1, 0)
+
+
+    def set_pixel(self, frame_buffer, x, y, colored):
+        self.mark_dirty(x, y, x, y)
+        self._set_pixel(frame_buffer, x, y, colored)
+
+
+    def _set_pixel(self, frame_buffer, x, y, colored):
+        clip = self._clip
+        if (x < clip[0] or x > clip[2] or y < clip[1] or y > clip[3]):
+            return
+        self._put_pixel(frame_buffer, x, y, colored)
+
+
+    # Sets a pixel known to be within the clip rectangle, unchecked
+    def _put_pixel(self, frame_buffer, x, y, colored):
+        if (self.rotate == ROTATE_0 or self.logical_buffers):
+            pass
+        elif (self.rotate == ROTATE_90):
+            point_temp = x
+            x = self.WIDTH - 1 - y
+            y = point_temp
+        elif (self.rotate == ROTATE_180):
+            x = self.WIDTH - 1 - x
+            y = self.HEIGHT - 1 - y
+        elif (self.rotate == ROTATE_270):
+            point_temp = x
+            x = y
+            y = self.HEIGHT - 1 - point_temp
+        if (colored):
+            frame_buffer[(x + y * self.buffer_width) >> 3] &= ~(0x80 >> (x & 7))
+        else:
+            frame_buffer[(x + y * self.buffer_width) >> 3] |= 0x80 >> (x & 7)
+
+
+    # Sets a pixel in panel coordinates, whatever the orientation
+    def set_absolute_pixel(self, frame_buffer, x, y, colored):
+        self.mark_absolute_dirty(x, y, x, y)
+        if self.logical_buffers:
+            x, y, _, _ = self._logical_rect(x, y, x, y)
+        self._set_absolute_pixel(frame_buffer, x, y, colored)
+
+
+    # Sets a pixel in buffer coordinates
+    def _set_absolute_pixel(self, frame_buffer, x, y, colored):
+        # To avoid display orientation effects
+        # use self.buffer_width instead of self.width
+        # use self.buffer_height instead of self.height
+        if (x < 0 or x >= self.buffer_width or y < 0 or y >= self.buffer_height):
+            return
+        if (colored):
+            frame_buffer[(x + y * self.buffer_width) // 8] &= ~(0x80 >> (x % 8))
+        else:
+            frame_buffer[(x + y * self.buffer_width) // 8] |= 0x80 >> (x % 8)
+
+
+    def draw_char_at(self, frame_buffer, x, y, char, font, colored):
+        data, offset, width = font_glyph(font, char)
+        self._draw_bits(frame_buffer, data, offset, width, font.height, x, y, colored)
+
+    # Draws a 1 bit per pixel image whose set bits are drawn, like a glyph:
+    # height rows of (width + 7) // 8 bytes starting at data[offset], every
+    # row stride bytes after the previous one (negative for bottom-up images).
+    # Rows are merged into the frame buffer a byte at a time, images on
+    # rotated panel buffers are turned to the panel orientation first.
+    def _draw_bits(self, frame_buffer, data, offset, width, height, x, y, colored, stride=None):
+        rect = self._clip_rect(x, y, x + width - 1, y + height - 1)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        row_bytes = (width + 7) // 8
+        if stride is None:
+            stride = row_bytes
+
+        fbuf = self._framebuf(frame_buffer)
+        # framebuf only clips to the buffer
+        if fbuf is not None and (self.clip is None or rect == (x, y, x + width - 1, y + height - 1)):
+            self._blit_bits(fbuf, data, offset, width, height, x, y, colored, stride)
+            return
+
+        if self.rotate == ROTATE_0 or self.logical_buffers:
+            self._merge_bits(frame_buffer, data, offset, row_bytes, width, height, x, y, colored, stride)
+            return
+        x0, y0, x1, y1 = self._panel_rect(x, y, x + width - 1, y + height - 1)
+        out_bytes, padding = self._turn_bits(data, offset, row_bytes, width, height, stride)
+        self._merge_bits(frame_buffer, self._bits, 0, out_bytes, out_bytes * 8,
+                         y1 - y0 + 1, x0 - padding, y0, colored, out_bytes)
+
+    # Copies a 1 bit per pixel image into self._bits, turned from the current
+    # orientation to the panel one. Quarter turns transpose 8x8 blocks, half
+    # turns mirror rows. Returns the size of the copied rows in bytes, and
+    # the count of blank pixels at the left of them.
+    def _turn_bits(self, data, offset, row_bytes, width, height, stride):
+        last_mask = (0xFF << (-width & 7)) & 0xFF
+        if self.rotate == ROTATE_180:
+            out_bytes = row_bytes
+            size = row_bytes * height
+        else:
+            out_bytes = (height + 7) // 8
+            size = out_bytes * width
+        if len(self._bits) < size:
+            self._bits = bytearray(size)
+        out = self._bits
+        reverse = REVERSE_TABLE
+
+        if self.rotate == ROTATE_180:
+            for row in range(height):
+                src = offset + (height - 1 - row) * stride + row_bytes - 1
+                dst = row * row_bytes
+                out[dst] = reverse[data[src] & last_mask]
+                for i in range(1, row_bytes):
+                    out[dst + i] = reverse[data[src - i]]
+            return out_bytes, row_bytes * 8 - width
+
+        block = bytearray(8)
+        for block_row in range(out_bytes):
+            for column in range(row_bytes):
+                mask = last_mask if column == row_bytes - 1 else 0xFF
+                src = offset + (block_row << 3) * stride + column
+                for i in range(8):
+                    if (block_row << 3) + i < height:
+                        block[i] = data[src + i * stride] & mask
+                    else:
+                        block[i] = 0
+                transpose8(block)
+                # row i of the block is column 8 * column + i of the image
+                for i in range(8):
+                    image_column = (column << 3) + i
+                    if image_column >= width:
+                        break
+                    if self.rotate == ROTATE_90:
+                        out[image_column * out_bytes + out_bytes - 1 - block_row] = reverse[block[i]]
+                    else:
+                        out[(width - 1 - image_column) * out_bytes + block_row] = block[i]
+        if self.rotate == ROTATE_90:
+            return out_bytes, out_bytes * 8 - height
+        return out_bytes, 0
+
+    # Merges height rows of row_bytes bytes, stride bytes apart and starting
+    # at data[offset], into the buffer at (x, y) in buffer coordinates.
+    # Every source byte is shifted to the destination bit offset and spread
+    # over two bytes, unless the destination is byte aligned.
+    # Pixels past width in the source rows, or outside of the clip rectangle,
+    # are skipped.
+    def _merge_bits(self, frame_buffer, data, offset, row_bytes, width, height, x, y, colored, stride):
+        buffer_stride = self.buffer_width // 8
+        clip_x0, clip_y0, clip_x1, clip_y1 = self._buffer_clip
+        first_row = max(0, clip_y0 - y)
+        last_row = min(height, clip_y1 + 1 - y)
+        shift = x & 7
+        start = x >> 3
+        # buffer bytes within the clip rectangle, and their pixels within it
+        # at the edges
+        clip_first = clip_x0 >> 3
+        clip_last = clip_x1 >> 3
+        clip_first_mask = 0xFF >> (clip_x0 & 7)
+        clip_last_mask = (0xFF << (7 - (clip_x1 & 7))) & 0xFF
+        # source bytes landing at least partly in the clip rectangle
+        first = max(0, clip_first - start - (1 if shift else 0))
+        last = min(row_bytes, clip_last + 1 - start)
+        last_mask = (0xFF << (-width & 7)) & 0xFF
+        for row in range(first_row, last_row):
+            src = offset + row * stride
+            dst = (y + row) * buffer_stride + start
+            if not shift:
+                for i in range(first, last):
+                    bits = data[src + i]
+                    if i == row_bytes - 1:
+                        bits &= last_mask
+                    if start + i == clip_first:
+                        bits &= clip_first_mask
+                    if start + i == clip_last:
+                        bits &= clip_last_mask
+                    if colored:
+                        frame_buffer[dst + i] &= ~bits
+                    else:
+                        frame_buffer[dst + i] |= bits
+                continue
+            for i in range(first, last):
+                bits = data[src + i]
+                if i == row_bytes - 1:
+                    bits &= last_mask
+                if not bits:
+                    continue
+                high = bits >> shift
+                low = (bits << (8 - shift)) & 0xFF
+                column = start + i
+                if column >= clip_first:
+                    if column == clip_first:
+                        high &= clip_first_mask
+                    if column == clip_last:
+                        high &= clip_last_mask
+                    if colored:
+                        frame_buffer[dst + i] &= ~high
+                    else:
+                        frame_buffer[dst + i] |= high
+                if low and column < clip_last:
+                    if column + 1 == clip_first:
+                        low &= clip_first_mask
+                    if column + 1 == clip_last:
+                        low &= clip_last_mask
+                    if colored:
+                        frame_buffer[dst + i + 1] &= ~low
+                    else:
+                        frame_buffer[dst + i + 1] |= low
+
+
+    # Characters outside of the frame are skipped, see textlayout.py
+    # for measuring, wrapping and aligning text
+    def display_string_at(self, frame_buffer, x, y, text, font, colored):
+        clip_x0, clip_y0, clip_x1, clip_y1 = self._clip
+        if y > clip_y1 or y + font.height <= clip_y0:
+            return
+        refcolumn = x
+
+        # Send the string character by character on EPD
+        for char in text:
+            if refcolumn > clip_x1:
+                break
+            width = char_width(font, char)
+            # Display one character on EPD, if any of it is visible
+            if refcolumn + width > clip_x0:
+                self.draw_char_at(frame_buffer, refcolumn, y, char, font, colored)
+            refcolumn += width
+
+
+    # Draws a line, end points included. Lines thicker than a pixel are
+    # widened across their main direction, centered on it.
+    def draw_line(self, frame_buffer, x0, y0, x1, y1, colored, thickness=1):
+        self._thick_line(frame_buffer, self._framebuf(frame_buffer), x0, y0, x1, y1, colored, thickness)
+
+
+    # Draws lines joining points, a sequence of (x, y) pairs, and the last
+    # point to the first one if closed, e.g. graphs and gauge needles
+    def draw_polyline(self, frame_buffer, points, colored, thickness=1, closed=False):
+        if not points:
+            return
+        fbuf = self._framebuf(frame_buffer)
+        if closed:
+            x0, y0 = points[-1]
+            first = 0
+        else:
+            x0, y0 = points[0]
+            first = 1 if len(points) > 1 else 0
+        for i in range(first, len(points)):
+            x1, y1 = points[i]
+            self._thick_line(frame_buffer, fbuf, x0, y0, x1, y1, colored, thickness)
+            x0, y0 = x1, y1
+
+
+    def _thick_line(self, frame_buffer, fbuf, x0, y0, x1, y1, colored, thickness):
+        if thickness <= 1:
+            self._line(frame_buffer, fbuf, x0, y0, x1, y1, colored)
+            return
+        # parallel lines side by side, so there are no gaps between them
+        first = -((thickness - 1) // 2)
+        if abs(x1 - x0) >= abs(y1 - y0):
+            for offset in range(first, first + thickness):
+                self._line(frame_buffer, fbuf, x0, y0 + offset, x1, y1 + offset, colored)
+        else:
+            for offset in range(first, first + thickness):
+                self._line(frame_buffer, fbuf, x0 + offset, y0, x1 + offset, y1, colored)
+
+    # Draws a one pixel line, clipped once: horizontal and vertical lines
+    # are filled as spans, the others walked over their visible part only.
+    def _line(self, frame_buffer, fbuf, ax, ay, bx, by, colored):
+        clip_x0, clip_y0, clip_x1, clip_y1 = self._clip
+        code_a = _outcode(ax, ay, clip_x0, clip_y0, clip_x1, clip_y1)
+        code_b = _outcode(bx, by, clip_x0, clip_y0, clip_x1, clip_y1)
+        if code_a & code_b:
+            return
+        if ax == bx or ay == by:
+            rect = self._clip_rect(ax, ay, bx, by)
+            if rect is None:
+                return
+            x0, y0, x1, y1 = rect
+            self.mark_dirty(x0, y0, x1, y1)
+            if fbuf is None:
+                self._fill_clipped_rect(frame_buffer, x0, y0, x1, y1, colored)
+            elif y0 == y1:
+                fbuf.hline(x0, y0, x1 - x0 + 1, 0 if colored else 1)
+            else:
+                fbuf.vline(x0, y0, y1 - y0 + 1, 0 if colored else 1)
+            return
+        # framebuf only clips to the buffer
+        if fbuf is not None and (self.clip is None or not (code_a | code_b)):
+            self.mark_dirty(ax, ay, bx, by)
+            fbuf.line(ax, ay, bx, by, 0 if colored else 1)
+            return
+        self._walk_line(frame_buffer, ax, ay, bx, by, colored)
+
+    # Pixel of the line from (ax, ay) to (bx, by) after step steps along its
+    # main direction. The other coordinate is rounded, halves away from a.
+    def _line_point(self, ax, ay, bx, by, step):
+        dx = bx - ax
+        dy = by - ay
+        if abs(dx) >= abs(dy):
+            minor = (2 * step * abs(dy) + abs(dx)) // (2 * abs(dx))
+            return ax + (step if dx > 0 else -step), ay + (minor if dy > 0 else -minor)
+        minor = (2 * step * abs(dx) + abs(dy)) // (2 * abs(dy))
+        return ax + (minor if dx > 0 else -minor), ay + (step if dy > 0 else -step)
+
+    # Sets the pixels of the line from (ax, ay) to (bx, by) within the clip
+    # rectangle, Bresenham style, in buffer terms: a step moves the buffer
+    # column and row offset by fixed amounts in any orientation. Diagonals
+    # move both at every step. The visible steps are worked out first from
+    # the rounding of _line_point, so clipped lines keep the pixels they'd
+    # have unclipped, and are written unchecked.
+    def _walk_line(self, frame_buffer, ax, ay, bx, by, colored):
+        clip_x0, clip_y0, clip_x1, clip_y1 = self._clip
+        dx = abs(bx - ax)
+        dy = abs(by - ay)
+        if dx >= dy:
+            major, minor = dx, dy
+            first, last = _axis_range(ax, bx, clip_x0, clip_x1)
+            low, high = _axis_range(ay, by, clip_y0, clip_y1)
+        else:
+            major, minor = dy, dx
+            first, last = _axis_range(ay, by, clip_y0, clip_y1)
+            low, high = _axis_range(ax, bx, clip_x0, clip_x1)
+        # steps rounding to minor offsets from low to high
+        first = max(0, first, -((major - 2 * major * low) // (2 * minor)))
+        last = min(major, last, -((major - 2 * major * (high + 1)) // (2 * minor)) - 1)
+        if first > last:
+            return
+        x, y = self._line_point(ax, ay, bx, by, first)
+        end_x, end_y = self._line_point(ax, ay, bx, by, last)
+        self.mark_dirty(x, y, end_x, end_y)
+
+        x_column, x_row, y_column, y_row = self._line_steps
+        if bx < ax:
+            x_column, x_row = -x_column, -x_row
+        if by < ay:
+            y_column, y_row = -y_column, -y_row
+        if dx >= dy:
+            major_column, major_row, minor_column, minor_row = x_column, x_row, y_column, y_row
+        else:
+            major_column, major_row, minor_column, minor_row = y_column, y_row, x_column, x_row
+        column, row, _, _ = self._buffer_rect(x, y, x, y)
+        row *= self.buffer_width // 8
+
+        if major == minor:
+            column_step = major_column + minor_column
+            row_step = major_row + minor_row
+            for _ in range(last - first + 1):
+                if colored:
+                    frame_buffer[row + (column >> 3)] &= ~(0x80 >> (column & 7))
+                else:
+                    frame_buffer[row + (column >> 3)] |= 0x80 >> (column & 7)
+                column += column_step
+                row += row_step
+            return
+
+        # remainder of the rounded minor coordinate, in units of 1 / (2 * major)
+        error = (2 * first * minor + major) % (2 * major)
+        for _ in range(last - first + 1):
+            if colored:
+                frame_buffer[row + (column >> 3)] &= ~(0x80 >> (column & 7))
+            else:
+                frame_buffer[row + (column >> 3)] |= 0x80 >> (column & 7)
+            column += major_column
+            row += major_row
+            error += 2 * minor
+            if error >= 2 * major:
+                error -= 2 * major
+                column += minor_column
+                row += minor_row
+
+
+    def draw_horizontal_line(self, frame_buffer, x, y, width, colored):
+        if width <= 0:
+            return
+        rect = self._clip_rect(x, y, x + width - 1, y)
+        if rect is None:
+            return
+        x0, y0, x1, y1 = rect
+        self.mark_dirty(x0, y0, x1, y1)
+        fbuf = self._framebuf(frame_buffer)
+        if fbuf is not None:
+            fbuf.hline(x0, y0, x1 - x0 + 1, 0 if colored else 1)
+            return
+        self._fill_clipped_rect(frame_buffer, x0, y0, x1, y1, colored)
+
+
+    def draw_vertical_line(self, frame_buffer, x, y, height, colored):
+        if height <= 0:
+            return
+        rect = self._clip_rect(x, y, x, y + height - 1)
+        if rect is None:
+            return
+        x0, y0, x1, y1 = rect
+        self.mark_dirty(x0, y0, x1, y1)
+        fbuf = self._framebuf(frame_buffer)
+        if fbuf is not None:
+            fbuf.vline(x0, y0, y1 - y0 + 1, 0 if colored else 1)
+            return
+        self._fill_clipped_rect(frame_buffer, x0, y0, x1, y1, colored)
+
+
+    def draw_rectangle(self, frame_buffer, x0, y0, x1, y1, colored):
+        min_x = x0 if x1 > x0 else x1
+        max_x = x1 if x1 > x0 else x0
+        min_y = y0 if y1 > y0 else y1
+        max_y = y1 if y1 > y0 else y0
+        rect = self._clip_rect(min_x, min_y, max_x, max_y)
+        if rect is None:
+            return
+        fbuf = self._framebuf(frame_buffer)
+        # framebuf only clips to the buffer
+        if fbuf is not None and (self.clip is None or rect == (min_x, min_y, max_x, max_y)):
+            self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+            fbuf.rect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1, 0 if colored else 1)
+            return
+        self.draw_horizontal_line(frame_buffer, min_x, min_y, max_x - min_x + 1, colored)
+        self.draw_horizontal_line(frame_buffer, min_x, max_y, max_x - min_x + 1, colored)
+        self.draw_vertical_line(frame_buffer, min_x, min_y, max_y - min_y + 1, colored)
+        self.draw_vertical_line(frame_buffer, max_x, min_y, max_y - min_y + 1, colored)
+
+
+    def draw_filled_rectangle(self, frame_buffer, x0, y0, x1, y1, colored):
+        min_x = x0 if x1 > x0 else x1
+        max_x = x1 if x1 > x0 else x0
+        min_y = y0 if y1 > y0 else y1
+        max_y = y1 if y1 > y0 else y0
+        rect = self._clip_rect(min_x, min_y, max_x, max_y)
+        if rect is None:
+            return
+        min_x, min_y, max_x, max_y = rect
+        self.mark_dirty(min_x, min_y, max_x, max_y)
+        fbuf = self._framebuf(frame_buffer)
+        if fbuf is not None:
+            fbuf.fill_rect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1, 0 if colored else 1)
+            return
+        self._fill_clipped_rect(frame_buffer, min_x, min_y, max_x, max_y, colored)
+
+
+    # Circles within the clip rectangle are drawn unchecked, the ones
+    # outside of it are skipped at once
+    def draw_circle(self, frame_buffer, x, y, radius, colored):
+        # Bresenham algorithm
+        x_pos = -radius
+        y_pos = 0
+        err = 2 - 2 * radius
+        rect = self._clip_rect(x - radius, y - radius, x + radius, y + radius)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        if rect == (x - radius, y - radius, x + radius, y + radius):
+            set_pixel = self._put_pixel
+        else:
+            set_pixel = self._set_pixel
+        while True:
+            set_pixel(frame_buffer, x - x_pos, y + y_pos, colored)
+            set_pixel(frame_buffer, x + x_pos, y + y_pos, colored)
+            set_pixel(frame_buffer, x + x_pos, y - y_pos, colored)
+            set_pixel(frame_buffer, x - x_pos, y - y_pos, colored)
+            e2 = err
+            if (e2 <= y_pos):
+                y_pos += 1
+                err += y_pos * 2 + 1
+                if(-x_pos == y_pos and e2 <= x_pos):
+                    e2 = 0
+            if (e2 > x_pos):
+                x_pos += 1
+                err += x_pos * 2 + 1
+            if x_pos > 0:
+                break
+
+
+    # Fills the rows of the circle draw_circle outlines, each once
+    def draw_filled_circle(self, frame_buffer, x, y, radius, colored):
+        if radius < 0:
+            return
+        rect = self._clip_rect(x - radius, y - radius, x + radius, y + radius)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        widths = _circle_widths(radius)
+        for row in range(rect[1], rect[3] + 1):
+            dy = abs(row - y)
+            if dy < len(widths):
+                self._fill_span(frame_buffer, row, x - widths[dy], x + widths[dy], colored)
+
+
+    def draw_ellipse(self, frame_buffer, x, y, x_radius, y_radius, colored):
+        self._draw_ellipse(frame_buffer, x, y, x_radius, y_radius, colored, False)
+
+
+    def draw_filled_ellipse(self, frame_buffer, x, y, x_radius, y_radius, colored):
+        self._draw_ellipse(frame_buffer, x, y, x_radius, y_radius, colored, True)
+
+
+    def _draw_ellipse(self, frame_buffer, x, y, x_radius, y_radius, colored, filled):
+        if x_radius < 0 or y_radius < 0:
+            return
+        widths = _ellipse_widths(x_radius, y_radius)
+        lefts = [x - widths[abs(dy)] for dy in range(-y_radius, y_radius + 1)]
+        rights = [x + widths[abs(dy)] for dy in range(-y_radius, y_radius + 1)]
+        self._draw_rows(frame_buffer, y - y_radius, lefts, rights, colored, filled)
+
+
+    def draw_rounded_rectangle(self, frame_buffer, x0, y0, x1, y1, radius, colored):
+        self._draw_rounded_rectangle(frame_buffer, x0, y0, x1, y1, radius, colored, False)
+
+
+    def draw_filled_rounded_rectangle(self, frame_buffer, x0, y0, x1, y1, radius, colored):
+        self._draw_rounded_rectangle(frame_buffer, x0, y0, x1, y1, radius, colored, True)
+
+
+    # Corners are quarters of a circle of radius, at most half of the
+    # shorter side
+    def _draw_rounded_rectangle(self, frame_buffer, x0, y0, x1, y1, radius, colored, filled):
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        radius = max(0, min(radius, (x1 - x0) // 2, (y1 - y0) // 2))
+        widths = _circle_widths(radius)
+        lefts = []
+        rights = []
+        for row in range(y0, y1 + 1):
+            dy = max(y0 + radius - row, row - (y1 - radius), 0)
+            inset = radius - widths[dy]
+            lefts.append(x0 + inset)
+            rights.append(x1 - inset)
+        self._draw_rows(frame_buffer, y0, lefts, rights, colored, filled)
+
+
+    # Draws a shape given by the extents of its rows: row top + i holds the
+    # pixels lefts[i] to rights[i]. Rows are filled with a span each, or
+    # outlined with the pixels joining them to the rows next to them.
+    def _draw_rows(self, frame_buffer, top, lefts, rights, colored, filled):
+        clip_y0 = self._clip[1]
+        clip_y1 = self._clip[3]
+        count = len(lefts)
+        first = max(0, clip_y0 - top)
+        last = min(count - 1, clip_y1 - top)
+        if first > last:
+            return
+        rect = self._clip_rect(min(lefts), top + first, max(rights), top + last)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        for i in range(first, last + 1):
+            left = lefts[i]
+            right = rights[i]
+            if left > right:
+                continue
+            if filled or i == 0 or i == count - 1:
+                self._fill_span(frame_buffer, top + i, left, right, colored)
+                continue
+            inner_left = max(left, max(lefts[i - 1], lefts[i + 1]) - 1)
+            inner_right = min(right, min(rights[i - 1], rights[i + 1]) + 1)
+            if inner_left + 1 >= inner_right:
+                self._fill_span(frame_buffer, top + i, left, right, colored)
+            else:
+                self._fill_span(frame_buffer, top + i, left, inner_left, colored)
+                self._fill_span(frame_buffer, top + i, inner_right, right, colored)
+
+    # Fills the pixels x0 to x1 of row y, which is within the clip rectangle
+    def _fill_span(self, frame_buffer, y, x0, x1, colored):
+        clip = self._clip
+        if x0 < clip[0]:
+            x0 = clip[0]
+        if x1 > clip[2]:
+            x1 = clip[2]
+        if x0 <= x1:
+            self._fill_clipped_rect(frame_buffer, x0, y, x1, y, colored)
+
+
+    # Outlines the polygon through points, a sequence of (x, y) pairs
+    def draw_polygon(self, frame_buffer, points, colored, thickness=1):
+        self.draw_polyline(frame_buffer, points, colored, thickness, True)
+
+
+    # Fills the polygon through points, a sequence of (x, y) pairs, edges
+    # included: every pixel draw_polygon sets is filled as well. Overlapping
+    # parts are filled by the even-odd rule. Rows are scanned with an edge
+    # table: the edges crossing a row give the spans filled, widened to the
+    # pixels the edges set on the row, each row span once.
+    def draw_filled_polygon(self, frame_buffer, points, colored):
+        if not points:
+            return
+        # edges as (top, bottom, x at top, x at bottom, the end points as
+        # draw_polygon draws them), sorted by top; horizontal ones as
+        # (y, x0, x1)
+        edges = []
+        flat = []
+        x0, y0 = points[-1]
+        left = right = x0
+        top = bottom = y0
+        for x1, y1 in points:
+            if y0 < y1:
+                edges.append((y0, y1, x0, x1, (x0, y0, x1, y1)))
+            elif y0 > y1:
+                edges.append((y1, y0, x1, x0, (x0, y0, x1, y1)))
+            else:
+                flat.append((y0, min(x0, x1), max(x0, x1)))
+            left = min(left, x1)
+            right = max(right, x1)
+            top = min(top, y1)
+            bottom = max(bottom, y1)
+            x0, y0 = x1, y1
+        rect = self._clip_rect(left, top, right, bottom)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        edges.sort()
+
+        active = []
+        next_edge = 0
+        for y in range(rect[1], rect[3] + 1):
+            while next_edge < len(edges) and edges[next_edge][0] <= y:
+                active.append(edges[next_edge])
+                next_edge += 1
+            active = [edge for edge in active if edge[1] >= y]
+            crossings = []
+            spans = []
+            for edge_top, edge_bottom, top_x, bottom_x, line in active:
+                if y < edge_bottom:
+                    crossings.append(top_x + _div_round((bottom_x - top_x) * (y - edge_top), edge_bottom - edge_top))
+                spans.append(_line_row(line[0], line[1], line[2], line[3], y))
+            crossings.sort()
+            for i in range(0, len(crossings) - 1, 2):
+                spans.append((crossings[i], crossings[i + 1]))
+            for flat_y, flat_x0, flat_x1 in flat:
+                if flat_y == y:
+                    spans.append((flat_x0, flat_x1))
+            if not spans:
+                continue
+            spans.sort()
+            span_x0, span_x1 = spans[0]
+            for x0, x1 in spans:
+                if x0 > span_x1 + 1:
+                    self._fill_span(frame_buffer, y, span_x0, span_x1, colored)
+                    span_x0 = x0
+                span_x1 = max(span_x1, x1)
+            self._fill_span(frame_buffer, y, span_x0, span_x1, colored)
+
+
+    # Draws an arc of a circle, thickness pixels wide inwards, from angle
+    # start to angle end in degrees: 0 points right, angles grow clockwise.
+    # Ends 360 degrees or more apart give a ring, one pixel wide it's the
+    # circle draw_circle draws. Ends at the same angle draw nothing.
+    def draw_arc(self, frame_buffer, x, y, radius, start, end, colored, thickness=1):
+        self._draw_sector(frame_buffer, x, y, radius, radius - thickness + 1, start, end, colored)
+
+
+    # Fills a circle sector, angles as in draw_arc, e.g. for gauges. A whole
+    # turn is the circle draw_filled_circle fills.
+    def draw_pie(self, frame_buffer, x, y, radius, start, end, colored):
+        self._draw_sector(frame_buffer, x, y, radius, -1, start, end, colored)
+
+
+    # Fills the pixels of the circle of radius outside of the inside of the
+    # outline of the one of inner_radius (none if negative) between angles
+    # start and end. Both circles are taken as draw_circle draws them. A row
+    # of the ring is one or two spans, the sector is one or two ranges of
+    # the row on the right side of the lines from the center along start
+    # and end, and the spans are clipped to them.
+    def _draw_sector(self, frame_buffer, x, y, radius, inner_radius, start, end, colored):
+        full = end - start >= 360
+        sweep = (end - start) % 360
+        if radius < 0 or inner_radius > radius or not (full or sweep):
+            return
+        rect = self._clip_rect(x - radius, y - radius, x + radius, y + radius)
+        if rect is None:
+            return
+        self.mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        widths = _circle_widths(radius)
+        inner_widths = _circle_widths(inner_radius) if inner_radius >= 0 else None
+        start_x, start_y = _direction(start)
+        end_x, end_y = _direction(end)
+        low = -radius - 1
+        high = radius + 1
+        for row in range(rect[1], rect[3] + 1):
+            dy = row - y
+            width = widths[abs(dy)]
+            if abs(dy) <= inner_radius:
+                inner = _circle_inside(inner_widths, abs(dy))
+                spans = ((-width, -inner - 1), (inner + 1, width))
+            else:
+                spans = ((-width, width),)
+            if full:
+                ranges = ((low, high),)
+            else:
+                # clockwise of start: start_x * dy - start_y * dx >= 0,
+                # anticlockwise of end: dx * end_y - dy * end_x >= 0
+                after_start = _half_line(start_y, start_x * dy, low, high)
+                before_end = _half_line(-end_y, -end_x * dy, low, high)
+                if sweep <= 180:
+                    ranges = ((max(after_start[0], before_end[0]), min(after_start[1], before_end[1])),)
+                else:
+                    ranges = (after_start, before_end)
+                    if after_start[0] > before_end[0]:
+                        ranges = (before_end, after_start)
+                    if ranges[0][1] + 1 >= ranges[1][0]:
+                        ranges = ((ranges[0][0], max(ranges[0][1], ranges[1][1])),)
+            for span_x0, span_x1 in spans:
+                for range_x0, range_x1 in ranges:
+                    x0 = max(span_x0, range_x0)
+                    x1 = min(span_x1, range_x1)
+                    if x0 <= x1:
+                        self._fill_span(frame_buffer, row, x + x0, x + x1, colored)
+
+
+    def draw_bmp(self, frame_buffer, image_path, colored, frame_buffer_red=None, dither=False):
+        self.draw_bmp_at(frame_buffer, 0, 0, image_path, colored, frame_buffer_red, dither)
+
+
+    # Draws the set bits of 1 bit BMPs, or whole 8 bit palette and 24 bit
+    # color BMPs. Color images are split into the black plane and, if given,
+    # frame_buffer_red: red pixels go to the red plane, the others are black
+    # or white by their gray level, thresholded or with Floyd-Steinberg
+    # dithering. colored is ignored for them.
+    def draw_bmp_at(self, frame_buffer, x, y, image_path, colored, frame_buffer_red=None, dither=False):
+        if x >= self.width or y >= self.height:
+            return
+
+        try:
+            with open(image_path, 'rb') as bmp_file:
+                data_offset, header_info, palette = self._bmp_header(image_path, bmp_file)
+                width = header_info.width
+                height = header_info.height
+                line_width = header_info.line_width
+
+                # rows within the frame
+                first = max(0, -y)
+                last = min(height, self.height - y)
+                if first >= last or x + width <= 0:
+                    return
+
+                if header_info.bit_depth != 1:
+                    self._draw_color_bmp(frame_buffer, frame_buffer_red, bmp_file, data_offset,
+                                         header_info, palette, x, y, first, last, dither)
+                    return
+
+                rows = max(1, BMP_READ_SIZE // line_width)
+                if len(self._bmp_rows) < rows * line_width:
+                    self._bmp_rows = bytearray(rows * line_width)
+                view = memoryview(self._bmp_rows)
+                row = first
+                while row < last:
+                    count = min(rows, last - row)
+                    # rows are stored bottom-up, so row + count - 1 comes first
+                    bmp_file.seek(data_offset + (height - row - count) * line_width)
+                    bmp_file.readinto(view[:count * line_width])
+                    self._draw_bits(frame_buffer, self._bmp_rows, (count - 1) * line_width, width, count,
+                                    x, y + row, colored, -line_width)
+                    row += count
+
+        except OSError as e:
+            print('error: {}'.format(e))
+
+    # Draws a packed 1 bit plane, see packbits.py, given as a PackedPlane,
+    # packed bytes or the path of a packed file, with its top left corner at
+    # (x, y). Unlike 1 bit BMPs the image replaces what's under it. Rows are
+    # unpacked straight into buffers that aren't turned when x and the image
+    # width are multiples of 8 and the image is within the clip rectangle,
+    # elsewhere a row at a time.
+    def draw_packed_at(self, frame_buffer, x, y, image):
+        if isinstance(image, str):
+            with open(image, 'rb') as packed_file:
+                self.draw_packed_at(frame_buffer, x, y, PackedPlane(packed_file))
+            return
+        if not isinstance(image, PackedPlane):
+            image = PackedPlane(image)
+        width = image.width
+        height = image.height
+        rect = self._clip_rect(x, y, x + width - 1, y + height - 1)
+        if rect is None:
+            return
+        row_bytes = (width + 7) // 8
+
+        if ((self.rotate == ROTATE_0 or self.logical_buffers) and isinstance(frame_buffer, (bytearray, memoryview))
+                and rect == (x, y, x + width - 1, y + height - 1) and not (x | width) & 7):
+            self.mark_dirty(x, y, x + width - 1, y + height - 1)
+            stride = self.buffer_width // 8
+            view = memoryview(frame_buffer)
+            start = y * stride + (x >> 3)
+            image.seek(0)
+            if row_bytes == stride:
+                image.readinto(view[start:start + height * stride])
+                return
+            for row in range(height):
+                image.readinto(view[start:start + row_bytes])
+                start += stride
+            return
+
+        # rows within the clip rectangle, drawn as their colored and uncolored bits
+        first = rect[1] - y
+        last = rect[3] + 1 - y
+        if len(self._bmp_rows) < 2 * row_bytes:
+            self._bmp_rows = bytearray(2 * row_bytes)
+        line = self._bmp_rows
+        view = memoryview(line)
+        image.seek(first * row_bytes)
+        for row in range(first, last):
+            image.readinto(view[:row_bytes])
+            for i in range(row_bytes):
+                line[row_bytes + i] = ~line[i] & 0xFF
+            self._draw_bits(frame_buffer, line, 0, width, 1, x, y + row, UNCOLORED)
+            self._draw_bits(frame_buffer, line, row_bytes, width, 1, x, y + row, COLORED)
+
+    # Forgets the BMP headers kept by draw_bmp_at, e.g. after rewriting a
+    # file without changing its size, where the modification time isn't kept
+    def clear_bmp_headers(self):
+        self._bmp_headers = []
+
+    # Data offset, BitmapHeaderInfo and palette of a BMP file, read from
+    # bmp_file or kept from one of the last BMP_HEADER_CACHE files drawn,
+    # if its size and modification time haven't changed since.
+    # The palette of 8 bit images is kept as the gray level and the red
+    # flag of every color, other images have none.
+    def _bmp_header(self, image_path, bmp_file):
+        stat = os.stat(image_path)
+        key = (image_path, stat[6], stat[8])
+        for cached_key, header in self._bmp_headers:
+            if cached_key == key:
+                return header
+        header = BitmapHeader(bmp_file.read(BitmapHeader.SIZE_IN_BYTES))
+        header_info = BitmapHeaderInfo(bmp_file.read(BitmapHeaderInfo.SIZE_IN_BYTES))
+        palette = None
+        if header_info.bit_depth == 8:
+            bmp_file.seek(BitmapHeader.SIZE_IN_BYTES + header_info.header_size)
+            colors = bmp_file.read(4 * header_info.colors)
+            levels = bytearray(256)
+            reds = bytearray(256)
+            for i in range(len(colors) // 4):
+                # blue, green, red, unused
+                levels[i] = _gray(colors[4 * i + 2], colors[4 * i + 1], colors[4 * i])
+                reds[i] = _is_red(colors[4 * i + 2], colors[4 * i + 1], colors[4 * i])
+            palette = (levels, reds)
+        header = (header.data_offset, header_info, palette)
+        headers = [entry for entry in self._bmp_headers if entry[0][0] != image_path]
+        headers.append((key, header))
+        del headers[:max(0, len(headers) - BMP_HEADER_CACHE)]
+        self._bmp_headers = headers
+        return header
+
+    # Streams the rows first..last - 1 of an 8 or 24 bit BMP, a row at a
+    # time. Every row is split into bit rows for the black, white and red
+    # pixels, drawn like 1 bit images. Dithering keeps the error of the
+    # current and the next row, so memory use only depends on the width.
+    def _draw_color_bmp(self, frame_buffer, frame_buffer_red, bmp_file, data_offset,
+                        header_info, palette, x, y, first, last, dither):
+        width = header_info.width
+        height = header_info.height
+        line_width = header_info.line_width
+        depth = header_info.bit_depth
+        row_bytes = (width + 7) // 8
+        if len(self._bmp_rows) < line_width:
+            self._bmp_rows = bytearray(line_width)
+        line = self._bmp_rows
+        view = memoryview(line)
+        black = bytearray(row_bytes)
+        white = bytearray(row_bytes)
+        red = bytearray(row_bytes)
+        other = bytearray(row_bytes)
+        blank = bytes(row_bytes)
+        if dither:
+            # errors times 16, of pixel i at i + 1
+            errors = [0] * (width + 2)
+            next_errors = [0] * (width + 2)
+        if palette is not None:
+            levels, reds = palette
+
+        for row in range(first, last):
+            bmp_file.seek(data_offset + (height - 1 - row) * line_width)
+            bmp_file.readinto(view[:line_width])
+            black[:] = blank
+            white[:] = blank
+            red[:] = blank
+            other[:] = blank
+            for i in range(width):
+                if depth == 8:
+                    level = levels[line[i]]
+                    is_red = reds[line[i]]
+                else:
+                    blue_value = line[3 * i]
+                    green_value = line[3 * i + 1]
+                    red_value = line[3 * i + 2]
+                    level = _gray(red_value, green_value, blue_value)
+                    is_red = _is_red(red_value, green_value, blue_value)
+                bit = 0x80 >> (i & 7)
+                if frame_buffer_red is not None:
+                    if is_red:
+                        red[i >> 3] |= bit
+                        white[i >> 3] |= bit
+                        continue
+                    other[i >> 3] |= bit
+                if dither:
+                    level += errors[i + 1] // 16
+                if level < BMP_THRESHOLD:
+                    black[i >> 3] |= bit
+                    error = level
+                else:
+                    white[i >> 3] |= bit
+                    error = level - 255
+                if dither:
+                    errors[i + 2] += error * 7
+                    next_errors[i] += error * 3
+                    next_errors[i + 1] += error * 5
+                    next_errors[i + 2] += error
+            if dither:
+                errors, next_errors = next_errors, errors
+                for i in range(width + 2):
+                    next_errors[i] = 0
+
+            self._draw_bits(frame_buffer, black, 0, width, 1, x, y + row, COLORED)
+            self._draw_bits(frame_buffer, white, 0, width, 1, x, y + row, UNCOLORED)
+            if frame_buffer_red is not None:
+                self._draw_bits(frame_buffer_red, red, 0, width, 1, x, y + row, COLORED)
+                self._draw_bits(frame_buffer_red, other, 0, width, 1, x, y + row, UNCOLORED)
@@ -0,0 +1,152 @@
+from drawing import COLORED, UNCOLORED, ROTATE_0, ROTATE_90, ROTATE_180, ROTATE_270
+from epdbase import EPDBase, FULL_REFRESH, PARTIAL_REFRESH
+
+
+# Display resolution
+EPD_WIDTH       = 200
+EPD_HEIGHT      = 200
+
+# EPD1IN54 commands
+DRIVER_OUTPUT_CONTROL                       = 0x01
+BOOSTER_SOFT_START_CONTROL                  = 0x0C
+GATE_SCAN_START_POSITION                    = 0x0F
+DEEP_SLEEP_MODE                             = 0x10
+DATA_ENTRY_MODE_SETTING                     = 0x11
+SW_RESET                                    = 0x12
+TEMPERATURE_SENSOR_CONTROL                  = 0x1A
+MASTER_ACTIVATION                           = 0x20
+DISPLAY_UPDATE_CONTROL_1                    = 0x21
+DISPLAY_UPDATE_CONTROL_2                    = 0x22
+WRITE_RAM                                   = 0x24
+WRITE_VCOM_REGISTER                         = 0x2C
+WRITE_LUT_REGISTER                          = 0x32
+SET_DUMMY_LINE_PERIOD                       = 0x3A
+SET_GATE_TIME                               = 0x3B
+BORDER_WAVEFORM_CONTROL                     = 0x3C
+SET_RAM_X_ADDRESS_START_END_POSITION        = 0x44
+SET_RAM_Y_ADDRESS_START_END_POSITION        = 0x45
+SET_RAM_X_ADDRESS_COUNTER                   = 0x4E
+SET_RAM_Y_ADDRESS_COUNTER                   = 0x4F
+TERMINATE_FRAME_READ_WRITE                  = 0xFF
+
+
+# Controller setup, see epdbase.SEQ_WAIT for the format
+INIT_SEQUENCE = (
+    b'\x01\x03\xC7\x00\x00'           # DRIVER_OUTPUT_CONTROL, EPD_HEIGHT - 1; GD = 0; SM = 0; TB = 0
+    b'\x0C\x03\xD7\xD6\x9D'           # BOOSTER_SOFT_START_CONTROL
+    b'\x2C\x01\xA8'                   # WRITE_VCOM_REGISTER, VCOM 7C
+    b'\x3A\x01\x1A'                   # SET_DUMMY_LINE_PERIOD, 4 dummy lines per gate
+    b'\x3B\x01\x08'                   # SET_GATE_TIME, 2us per line
+    b'\x11\x01\x03'                   # DATA_ENTRY_MODE_SETTING, X increment; Y increment
+)
+
+LUT_FULL_SEQUENCE = (
+    b'\x32\x1E'                       # WRITE_LUT_REGISTER
+    b'\x02\x02\x01\x11\x12\x12\x22\x22\x66\x69\x69\x59\x58\x99\x99'
+    b'\x88\x00\x00\x00\x00\xF8\xB4\x13\x51\x35\x51\x51\x19\x01\x00'
+)
+
+LUT_PARTIAL_SEQUENCE = (
+    b'\x32\x1E'                       # WRITE_LUT_REGISTER
+    b'\x10\x18\x18\x08\x18\x18\x08\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x13\x14\x44\x12\x00\x00\x00\x00\x00\x00'
+)
+
+SLEEP_SEQUENCE = (
+    b'\x10\x01\x01'                   # DEEP_SLEEP_MODE
+)
+
+REFRESH_SEQUENCE = (
+    b'\x22\x01\xC4'                   # DISPLAY_UPDATE_CONTROL_2
+    b'\x20\x00'                       # MASTER_ACTIVATION
+    b'\xFF\x80'                       # TERMINATE_FRAME_READ_WRITE, wait until idle
+)
+
+
+# 1.54" black/white e-Paper Module (first revision, IL3829 controller).
+# Besides the full refresh it supports a sub-second partial refresh,
+# select it with set_refresh_mode(PARTIAL_REFRESH) after a full refresh.
+# Only the region changed since the last frame is sent to the controller.
+class EPD(EPDBase):
+    WIDTH = EPD_WIDTH
+    HEIGHT = EPD_HEIGHT
+    BUSY_LEVEL = 1                    # 1: busy, 0: idle
+    BUSY_POLL_MS = 10
+    CHUNK_SIZE = EPD_WIDTH // 8 * 4
+    REFRESH_MODES = (FULL_REFRESH, PARTIAL_REFRESH)
+
+    INIT_SEQUENCE = INIT_SEQUENCE
+    SLEEP_SEQUENCE = SLEEP_SEQUENCE
+    REFRESH_SEQUENCE = REFRESH_SEQUENCE
+
+    supports_partial_window = True
+
+    def __init__(self, reset, dc, busy, cs, clk=None, mosi=None, bus=None, spi=None, baudrate=None):
+        super().__init__(reset, dc, busy, cs, clk, mosi, bus, spi, baudrate)
+        self._area = bytearray(4)
+        self._area_view = memoryview(self._area)
+
+    def _forget_frame(self):
+        super()._forget_frame()
+        self._windows = []
+
+    def lut_sequences(self):
+        if self.refresh_mode == PARTIAL_REFRESH:
+            return (LUT_PARTIAL_SEQUENCE,)
+        return (LUT_FULL_SEQUENCE,)
+
+    # The red plane is ignored
+    def send_planes(self, frame_buffer_black, frame_buffer_red, panel_layout=False):
+        self.send_window(frame_buffer_black, None, 0, 0, EPD_WIDTH - 1, EPD_HEIGHT - 1, panel_layout)
+
+    def send_window(self, frame_buffer_black, frame_buffer_red, x0, y0, x1, y1, panel_layout=False):
+        if frame_buffer_black is None:
+            return
+        # the controller addresses memory in bytes horizontally
+        x0 &= ~7
+        x1 |= 7
+        self._windows.append((frame_buffer_black, x0, y0, x1, y1, panel_layout))
+        self._write_window(frame_buffer_black, x0, y0, x1, y1, panel_layout)
+
+    # The controller has two memory banks and switches between them on every
+    # refresh, so the windows just displayed are written to the other one too.
+    def after_refresh(self):
+        for window in self._windows:
+            self._write_window(*window)
+        self._windows = []
+
+    # The window is set up and written holding the bus throughout
+    def _write_window(self, frame_buffer, x0, y0, x1, y1, panel_layout=False):
+        self.device.acquire()
+        try:
+            area = self._area
+            area[0] = x0 >> 3
+            area[1] = x1 >> 3
+            self.send_command_data(SET_RAM_X_ADDRESS_START_END_POSITION, self._area_view[:2])
+            area[0] = y0 & 0xFF
+            area[1] = y0 >> 8
+            area[2] = y1 & 0xFF
+            area[3] = y1 >> 8
+            self.send_command_data(SET_RAM_Y_ADDRESS_START_END_POSITION, area)
+            area[0] = x0 >> 3
+            self.send_command_data(SET_RAM_X_ADDRESS_COUNTER, self._area_view[:1])
+            area[0] = y0 & 0xFF
+            area[1] = y0 >> 8
+            self.send_command_data(SET_RAM_Y_ADDRESS_COUNTER, self._area_view[:2])
+
+            self.device.begin()
+            try:
+                self.dc_pin(False)
+                self.spi.write(WRITE_RAM)
+                self.dc_pin(True)
+                if x0 == 0 and x1 == EPD_WIDTH - 1:
+                    self.write_panel_rows(frame_buffer, y0, y1, panel_layout)
+                else:
+                    start = x0 >> 3
+                    end = (x1 >> 3) + 1
+                    for row in self.panel_rows(frame_buffer, y0, y1, panel_layout):
+                        self.spi.write(row[start:end])
+            finally:
+                self.device.end()
+        finally:
+            self.device.release()
@@ -0,0 +1,599 @@
+import utime
+from machine import Pin
+from spibus import SPIBus
+from drawing import Drawing, union_rect, transpose8, REVERSE_TABLE, ROTATE_0, ROTATE_90, ROTATE_180, ROTATE_270
+from packbits import MAGIC as PACKED_MAGIC, PackedPlane
+
+try:
+    from ubinascii import crc32
+except ImportError:
+    try:
+        from binascii import crc32
+    except ImportError:
+        crc32 = None
+
+
+# Refresh modes
+FULL_REFRESH = 0
+PARTIAL_REFRESH = 1
+
+# Busy pin handling in the asyncio variants
+BUSY_TIMEOUT_MS = 30000
+BUSY_POLL_MIN_MS = 5
+BUSY_POLL_MAX_MS = 50
+
+# Controller setup is stored as command sequences, where every entry is
+# a command byte, a payload length byte and the payload itself.
+# SEQ_WAIT set in the length byte means: wait until idle after the entry.
+SEQ_WAIT = 0x80
+
+# Planes are fingerprinted in bands of rows, so that only the bands
+# touched by drawing since the last transfer have to be checked again
+BAND_HEIGHT = 8
+
+
+# Cheap fingerprint of a plane, used to tell if the controller already holds it.
+# It's a CRC32 where available, and a copy of the data otherwise.
+def fingerprint(frame_buffer):
+    if not isinstance(frame_buffer, (bytes, bytearray, memoryview)):
+        frame_buffer = bytes(frame_buffer)
+    if crc32 is None:
+        return bytes(frame_buffer)
+    return crc32(frame_buffer)
+
+
+# What the controller holds for one plane: the buffer last sent,
+# its band fingerprints and the region drawn since then.
+class PlaneState:
+    def __init__(self, width, height):
+        self.band_size = width // 8 * BAND_HEIGHT
+        self.bands = (height + BAND_HEIGHT - 1) // BAND_HEIGHT
+        self.forget()
+
+    def forget(self):
+        self.buffer = None
+        self.fingerprints = [None] * self.bands
+        self.dirty = None
+        self.window = None
+
+    def add_dirty(self, rect):
+        if rect is not None:
+            self.dirty = union_rect(self.dirty, rect[0], rect[1], rect[2], rect[3])
+
+    # Returns True if frame_buffer differs from what was last sent.
+    # If the same buffer was sent before, only the bands in the dirty
+    # region are checked and self.window is set to that region.
+    # rows are the first and last buffer rows of the dirty region,
+    # if the buffer isn't laid out like the panel.
+    def update(self, frame_buffer, force=False, rows=None):
+        self.window = None
+        if force or frame_buffer is not self.buffer:
+            first, last = 0, self.bands - 1
+        elif self.dirty is None:
+            return False
+        else:
+            if rows is None:
+                rows = (self.dirty[1], self.dirty[3])
+            first = rows[0] // BAND_HEIGHT
+            last = rows[1] // BAND_HEIGHT
+            self.window = self.dirty
+        data = frame_buffer
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = memoryview(data)
+        changed = force
+        fingerprints = self.fingerprints
+        band_size = self.band_size
+        for band in range(first, last + 1):
+            band_fingerprint = fingerprint(data[band * band_size:(band + 1) * band_size])
+            if band_fingerprint != fingerprints[band]:
+                fingerprints[band] = band_fingerprint
+                changed = True
+        self.buffer = frame_buffer
+        self.dirty = None
+        return changed
+
+
+# Base class of panel drivers. It owns the SPI transport, busy handling,
+# refresh bookkeeping and the drawing functions. A driver defines:
+#  - WIDTH, HEIGHT: panel resolution
+#  - BUSY_LEVEL: busy pin value while the controller is busy
+#  - INIT_SEQUENCE, SLEEP_SEQUENCE, REFRESH_SEQUENCE: command sequences
+#  - REFRESH_MODES: supported refresh modes
+#  - lut_sequences(): waveform sequences for the current refresh mode
+#  - send_planes(): upload of whole planes
+#  - send_window(): upload of a region, if supports_partial_window is set
+# Both take panel_layout: planes laid out as the panel scans them whatever
+# the buffer layout, like static planes, which are never rotated.
+#
+# The panel is driven over its own SPI bus made on clk and mosi, over an
+# spi object it uses as is, or as one device of a shared spibus.SPIBus,
+# at baudrate (BAUDRATE by default). Every transfer is a transaction of
+# that device, so other devices can use the bus while the panel is busy.
+class EPDBase(Drawing):
+    BAUDRATE = 2000000
+    BUSY_LEVEL = 0
+    BUSY_POLL_MS = 100
+    CHUNK_SIZE = 200
+    REFRESH_MODES = (FULL_REFRESH,)
+
+    # Whether the driver can draw the red plane
+    has_red_plane = False
+    # Whether the controller can receive a window of the frame, see send_window
+    supports_partial_window = False
+
+    def __init__(self, reset, dc, busy, cs, clk=None, mosi=None, bus=None, spi=None, baudrate=None):
+        super().__init__()
+
+        self.reset_pin = reset
+        self.reset_pin.mode(Pin.OUT)
+
+        self.dc_pin = dc
+        self.dc_pin.mode(Pin.OUT)
+
+        self.busy_pin = busy
+        self.busy_pin.mode(Pin.IN)
+
+        self.cs_pin = cs
+        self.cs_pin.mode(Pin.OUT)
+        self.cs_pin.pull(Pin.PULL_UP)
+
+        if baudrate is None:
+            baudrate = self.BAUDRATE
+        if bus is None:
+            if spi is None:
+                bus = SPIBus(pins=(clk, mosi, None), baudrate=baudrate)
+            else:
+                bus = SPIBus(spi)
+                baudrate = None
+        self.bus = bus
+        self.device = bus.device(cs, baudrate)
+        self.spi = bus.spi
+
+        self._chunk = bytearray(self.CHUNK_SIZE)
+        self._chunk_view = memoryview(self._chunk)
+
+        # 8 panel rows rotated from logical buffers, and an 8x8 pixel block
+        self._band = bytearray(self.WIDTH // 8 * 8)
+        self._band_view = memoryview(self._band)
+        self._block = bytearray(8)
+
+        self.stats = None
+
+        self.refresh_mode = FULL_REFRESH
+        self._awake = False
+        self._black = PlaneState(self.WIDTH, self.HEIGHT)
+        self._red = PlaneState(self.WIDTH, self.HEIGHT)
+        self._forget_frame()
+
+    # Buffer contents mean something else after a layout change,
+    # so they are compared from scratch on the next transfer
+    def _update_layout(self):
+        super()._update_layout()
+        self._black = PlaneState(self.buffer_width, self.buffer_height)
+        self._red = PlaneState(self.buffer_width, self.buffer_height)
+
+    # Starts collecting timings and counters, see epdstats.EPDStats
+    def enable_stats(self):
+        if self.stats is not None:
+            return self.stats
+        from epdstats import EPDStats, CountingSPI, CountingPin
+        stats = EPDStats()
+        self._stats_wrapped = []
+        for phase, names in stats.PHASES:
+            for name in names:
+                if not hasattr(self, name):
+                    continue
+                method = getattr(self, name)
+                if name.endswith('_async'):
+                    setattr(self, name, stats.timed_async(phase, method))
+                else:
+                    setattr(self, name, stats.timed(phase, method))
+                self._stats_wrapped.append(name)
+        for name in dir(self.__class__):
+            if name in ('_set_pixel', '_put_pixel') or name.startswith('draw_') or name == 'display_string_at':
+                setattr(self, name, stats.counted(name.lstrip('_'), getattr(self, name)))
+                self._stats_wrapped.append(name)
+        self.spi = CountingSPI(self.spi, stats)
+        self.device.cs = CountingPin(self.device.cs, stats)
+        self.stats = stats
+        return stats
+
+    def disable_stats(self):
+        if self.stats is None:
+            return
+        for name in self._stats_wrapped:
+            delattr(self, name)
+        self.spi = self.spi.spi
+        self.device.cs = self.device.cs.pin
+        self.stats = None
+
+    def init(self):
+        self.reset()
+        self.send_sequence(self.INIT_SEQUENCE)
+        self.set_lut()
+        self._awake = True
+        return 0
+
+    async def init_async(self, timeout_ms=BUSY_TIMEOUT_MS):
+        await self.reset_async()
+        await self.send_sequence_async(self.INIT_SEQUENCE, timeout_ms)
+        await self.set_lut_async(timeout_ms)
+        self._awake = True
+        return 0
+
+    def set_lut(self):
+        for sequence in self.lut_sequences():
+            self.send_sequence(sequence)
+
+    async def set_lut_async(self, timeout_ms=BUSY_TIMEOUT_MS):
+        for sequence in self.lut_sequences():
+            await self.send_sequence_async(sequence, timeout_ms)
+
+    # Selects one of REFRESH_MODES. Waveforms are uploaded right away
+    # if the display is initialized, otherwise on the next init().
+    def set_refresh_mode(self, mode):
+        if mode not in self.REFRESH_MODES:
+            raise ValueError('unsupported refresh mode')
+        if mode == self.refresh_mode:
+            return
+        self.refresh_mode = mode
+        if self._awake:
+            self.set_lut()
+
+    def _spi_transfer(self, data):
+        self.device.begin()
+        try:
+            self.spi.write(data)
+        finally:
+            self.device.end()
+
+    def delay_ms(self, delaytime):
+        utime.sleep_ms(delaytime)
+
+    def send_command(self, command):
+        self.dc_pin(False)
+        self._spi_transfer(command)
+
+    def send_data(self, data):
+        self.dc_pin(True)
+        self._spi_transfer(data)
+
+    def send_command_data(self, command, payload):
+        self.device.begin()
+        try:
+            self.dc_pin(False)
+            self.spi.write(command)
+            if payload:
+                self.dc_pin(True)
+                self.spi.write(payload)
+        finally:
+            self.device.end()
+
+    # Writes count bytes of frame_buffer starting at start as data, within
+    # the transaction begun by the caller. Buffers that don't support
+    # the buffer protocol (e.g. lists), and files holding a plane, are
+    # copied through the chunk buffer.
+    def write_buffer(self, frame_buffer, start, count):
+        if isinstance(frame_buffer, (bytes, bytearray, memoryview)):
+            self.spi.write(memoryview(frame_buffer)[start:start + count])
+            return
+        chunk = self._chunk
+        chunk_size = len(chunk)
+        end = start + count
+        if hasattr(frame_buffer, 'readinto'):
+            frame_buffer.seek(start)
+            while start < end:
+                size = frame_buffer.readinto(self._chunk_view[:min(chunk_size, end - start)])
+                if not size:
+                    raise OSError('plane file too short')
+                self.spi.write(self._chunk_view[:size])
+                start += size
+            return
+        while start < end:
+            size = min(chunk_size, end - start)
+            for i in range(size):
+                chunk[i] = frame_buffer[start + i]
+            self.spi.write(self._chunk_view[:size])
+            start += size
+
+    # Yields the rows y0..y1 of a plane as the panel scans them, whatever
+    # the buffer layout. Rows are views, valid until the next one is taken.
+    # Files holding a plane are read a band at a time, and always hold it
+    # as the panel scans it, like planes passed with panel_layout set.
+    def panel_rows(self, frame_buffer, y0, y1, panel_layout=False):
+        stride = self.WIDTH // 8
+        band = self._band_view
+        if hasattr(frame_buffer, 'readinto'):
+            frame_buffer.seek(y0 * stride)
+            y = y0
+            while y <= y1:
+                rows = min(8, y1 - y + 1)
+                if frame_buffer.readinto(band[:rows * stride]) != rows * stride:
+                    raise OSError('plane file too short')
+                for row in range(rows):
+                    yield band[row * stride:(row + 1) * stride]
+                y += rows
+        elif self.logical_buffers and self.rotate != ROTATE_0 and not panel_layout:
+            for y in range(y0, y1 + 1):
+                row = y & 7
+                if row == 0 or y == y0:
+                    self._rotate_band(frame_buffer, y >> 3)
+                yield band[row * stride:(row + 1) * stride]
+        elif isinstance(frame_buffer, (bytes, bytearray, memoryview)):
+            data = memoryview(frame_buffer)
+            for y in range(y0, y1 + 1):
+                yield data[y * stride:(y + 1) * stride]
+        else:
+            for y in range(y0, y1 + 1):
+                start = y * stride
+                for i in range(stride):
+                    band[i] = frame_buffer[start + i]
+                yield band[:stride]
+
+    # Writes the rows y0..y1 of a plane as data, within the transaction
+    # begun by the caller. Rotated rows go out a band at a time.
+    def write_panel_rows(self, frame_buffer, y0, y1, panel_layout=False):
+        stride = self.WIDTH // 8
+        if panel_layout or not self.logical_buffers or self.rotate == ROTATE_0 or hasattr(frame_buffer, 'readinto'):
+            self.write_buffer(frame_buffer, y0 * stride, (y1 - y0 + 1) * stride)
+            return
+        for band in range(y0 >> 3, (y1 >> 3) + 1):
+            self._rotate_band(frame_buffer, band)
+            first = max(y0, band << 3) & 7
+            last = min(y1, (band << 3) + 7) & 7
+            self.spi.write(self._band_view[first * stride:(last + 1) * stride])
+
+    # Fills self._band with the panel rows 8 * band .. 8 * band + 7 taken
+    # from a logical buffer. Quarter turns move 8x8 blocks and transpose
+    # them, the half turn mirrors rows byte by byte.
+    def _rotate_band(self, frame_buffer, band):
+        stride = self.WIDTH // 8
+        logical_stride = self.buffer_width // 8
+        out = self._band
+        block = self._block
+        if self.rotate == ROTATE_180:
+            reverse = REVERSE_TABLE
+            for row in range(8):
+                start = (self.HEIGHT - 1 - (band << 3) - row) * logical_stride + stride - 1
+                pos = row * stride
+                for column in range(stride):
+                    out[pos + column] = reverse[frame_buffer[start - column]]
+        elif self.rotate == ROTATE_90:
+            # panel (x, y) is logical (y, WIDTH - 1 - x)
+            for column in range(stride):
+                start = (self.WIDTH - 1 - (column << 3)) * logical_stride + band
+                for i in range(8):
+                    block[i] = frame_buffer[start - i * logical_stride]
+                transpose8(block)
+                for row in range(8):
+                    out[row * stride + column] = block[row]
+        elif self.rotate == ROTATE_270:
+            # panel (x, y) is logical (HEIGHT - 1 - y, x)
+            source = logical_stride - 1 - band
+            for column in range(stride):
+                start = (column << 3) * logical_stride + source
+                for i in range(8):
+                    block[i] = frame_buffer[start + i * logical_stride]
+                transpose8(block)
+                for row in range(8):
+                    out[row * stride + column] = block[7 - row]
+
+    # Sends entries of a command sequence, stopping after every entry
+    # flagged with SEQ_WAIT so that the caller can wait for the controller.
+    # Entries up to a wait are sent as a batch, holding the bus throughout;
+    # it's released while waiting.
+    def _sequence(self, sequence):
+        data = memoryview(sequence)
+        pos = 0
+        while pos < len(data):
+            pos, wait = self._send_batch(data, pos)
+            if wait:
+                yield
+
+    # Sends entries from pos up to the first one flagged with SEQ_WAIT.
+    # Returns the position after the last one sent, and whether it's flagged.
+    def _send_batch(self, data, pos):
+        self.device.acquire()
+        try:
+            while pos < len(data):
+                length = data[pos + 1] & ~SEQ_WAIT
+                self.send_command_data(data[pos], data[pos + 2:pos + 2 + length])
+                wait = data[pos + 1] & SEQ_WAIT
+                pos += 2 + length
+                if wait:
+                    return pos, True
+            return pos, False
+        finally:
+            self.device.release()
+
+    def send_sequence(self, sequence):
+        for _ in self._sequence(sequence):
+            self.wait_until_idle()
+
+    async def send_sequence_async(self, sequence, timeout_ms=BUSY_TIMEOUT_MS):
+        for _ in self._sequence(sequence):
+            await self.wait_until_idle_async(timeout_ms)
+
+    def wait_until_idle(self):
+        while(self.busy_pin() == self.BUSY_LEVEL):
+            self.delay_ms(self.BUSY_POLL_MS)
+
+    # Waits for the busy pin to go idle without blocking the event loop.
+    # Uses a pin interrupt if uasyncio provides ThreadSafeFlag, otherwise polls
+    # the pin with an interval growing from BUSY_POLL_MIN_MS to BUSY_POLL_MAX_MS.
+    # Raises uasyncio.TimeoutError if the controller is busy for longer than timeout_ms.
+    async def wait_until_idle_async(self, timeout_ms=BUSY_TIMEOUT_MS):
+        import uasyncio as asyncio
+        if self.busy_pin() != self.BUSY_LEVEL:
+            return
+        if hasattr(asyncio, 'ThreadSafeFlag'):
+            flag = asyncio.ThreadSafeFlag()
+            self._set_busy_callback(lambda pin: flag.set())
+            try:
+                # the pin could go idle before the interrupt was enabled
+                if self.busy_pin() == self.BUSY_LEVEL:
+                    await asyncio.wait_for_ms(flag.wait(), timeout_ms)
+            finally:
+                self._set_busy_callback(None)
+            return
+        start = utime.ticks_ms()
+        delay = BUSY_POLL_MIN_MS
+        while(self.busy_pin() == self.BUSY_LEVEL):
+            if utime.ticks_diff(utime.ticks_ms(), start) > timeout_ms:
+                raise asyncio.TimeoutError
+            await asyncio.sleep_ms(delay)
+            delay = min(delay * 2, BUSY_POLL_MAX_MS)
+
+    def _set_busy_callback(self, handler):
+        trigger = Pin.IRQ_RISING if self.BUSY_LEVEL == 0 else Pin.IRQ_FALLING
+        if hasattr(self.busy_pin, 'callback'):
+            # Pycom API
+            self.busy_pin.callback(trigger, handler)
+        else:
+            self.busy_pin.irq(handler=handler, trigger=trigger)
+
+    def reset(self):
+        self.reset_pin(False)         # module reset
+        self.delay_ms(200)
+        self.reset_pin(True)
+        self.delay_ms(200)
+        self._forget_frame()
+
+    async def reset_async(self):
+        import uasyncio as asyncio
+        self.reset_pin(False)
+        await asyncio.sleep_ms(200)
+        self.reset_pin(True)
+        await asyncio.sleep_ms(200)
+        self._forget_frame()
+
+    # Planes the controller already holds are not sent again, and if nothing
+    # changed since the last refresh, the refresh is skipped as well.
+    # Pass force=True to always send the planes and refresh the display.
+    def display_frame(self, frame_buffer_black, frame_buffer_red=None, force=False):
+        if self.send_frame(frame_buffer_black, frame_buffer_red, force) or force:
+            self._refresh_pending = False
+            self.send_sequence(self.REFRESH_SEQUENCE)
+            self.after_refresh()
+
+    # Same as display_frame, but lets other tasks run during the refresh
+    async def display_frame_async(self, frame_buffer_black, frame_buffer_red=None, force=False, timeout_ms=BUSY_TIMEOUT_MS):
+        if self.send_frame(frame_buffer_black, frame_buffer_red, force) or force:
+            self._refresh_pending = False
+            await self.send_sequence_async(self.REFRESH_SEQUENCE, timeout_ms)
+            self.after_refresh()
+
+    # Displays planes read from files holding raw frame buffers as the panel
+    # scans them, or packed planes, see tools/frameconv.py. They are streamed
+    # to the controller through a small fixed buffer, no frame buffer is
+    # allocated. Packed planes are unpacked on the fly.
+    def display_frame_from_file(self, path_black, path_red=None):
+        file_black = self._open_plane(path_black)
+        try:
+            if path_red is None:
+                self.display_frame_from_buffer(file_black)
+                return
+            file_red = self._open_plane(path_red)
+            try:
+                self.display_frame_from_buffer(file_black, file_red)
+            finally:
+                file_red.close()
+        finally:
+            file_black.close()
+
+    def _open_plane(self, path):
+        plane_file = open(path, 'rb')
+        try:
+            packed = plane_file.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+            plane_file.seek(0)
+            if not packed:
+                return plane_file
+            plane = PackedPlane(plane_file)
+            if plane.width != self.WIDTH or plane.height != self.HEIGHT:
+                raise ValueError('{}: packed plane is {}x{}'.format(path, plane.width, plane.height))
+            return plane
+        except Exception:
+            plane_file.close()
+            raise
+
+    # Displays static planes, like frozen bytes, open files or PackedPlanes,
+    # which aren't drawn on: they are always sent, without checking them for
+    # changes. They hold the planes as the panel scans them, whatever the
+    # orientation and buffer layout, see tools/frameconv.py.
+    def display_frame_from_buffer(self, frame_buffer_black, frame_buffer_red=None):
+        self._black.forget()
+        self._red.forget()
+        if not self.has_red_plane:
+            frame_buffer_red = None
+        self.send_planes(frame_buffer_black, frame_buffer_red, panel_layout=True)
+        self._refresh_pending = False
+        self.send_sequence(self.REFRESH_SEQUENCE)
+        self.after_refresh()
+
+    # Called once the display is refreshed
+    def after_refresh(self):
+        pass
+
+    # Uploads the planes to the controller memory without refreshing the display.
+    # Returns True if the controller memory differs from what is displayed.
+    # If the buffers were sent before, only the region drawn since then is
+    # checked for changes, and sent as a window if the panel supports it.
+    def send_frame(self, frame_buffer_black, frame_buffer_red=None, force=False):
+        self._black.add_dirty(self.dirty)
+        self._red.add_dirty(self.dirty)
+        self.dirty = None
+
+        if not self.has_red_plane:
+            frame_buffer_red = None
+        black_changed = frame_buffer_black != None and self._update_plane(self._black, frame_buffer_black, force)
+        red_changed = frame_buffer_red != None and self._update_plane(self._red, frame_buffer_red, force)
+        if not (black_changed or red_changed):
+            return self._refresh_pending
+        self._refresh_pending = True
+
+        if not black_changed:
+            frame_buffer_black = None
+        if not red_changed:
+            frame_buffer_red = None
+
+        if self.supports_partial_window and not force:
+            window = self._changed_window(black_changed, red_changed)
+            if window is not None:
+                self.send_window(frame_buffer_black, frame_buffer_red,
+                                 window[0], window[1], window[2], window[3])
+                return True
+        self.send_planes(frame_buffer_black, frame_buffer_red)
+        return True
+
+    def _update_plane(self, plane, frame_buffer, force):
+        rows = None
+        if self.logical_buffers and plane.dirty is not None:
+            rect = self._logical_rect(plane.dirty[0], plane.dirty[1], plane.dirty[2], plane.dirty[3])
+            rows = (rect[1], rect[3])
+        return plane.update(frame_buffer, force, rows)
+
+    # Region covering the changes of both planes, or None if any of them
+    # has to be sent as a whole
+    def _changed_window(self, black_changed, red_changed):
+        window = None
+        for changed, plane in ((black_changed, self._black), (red_changed, self._red)):
+            if changed:
+                if plane.window is None:
+                    return None
+                window = union_rect(window, plane.window[0], plane.window[1], plane.window[2], plane.window[3])
+        return window
+
+    # Controller memory is lost on reset
+    def _forget_frame(self):
+        self._black.forget()
+        self._red.forget()
+        self._refresh_pending = False
+
+    # after this, call epd.init() to awaken the module
+    def sleep(self):
+        self.send_sequence(self.SLEEP_SEQUENCE)
+        self._awake = False
+
+    async def sleep_async(self, timeout_ms=BUSY_TIMEOUT_MS):
+        await self.send_sequence_async(self.SLEEP_SEQUENCE, timeout_ms)
+        self._awake = False
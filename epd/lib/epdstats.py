@@ -0,0 +1,106 @@
+import utime
+
+
+# Collects per-phase timings and call counters of an EPD instance.
+# Enable with EPD.enable_stats(), which wraps the instrumented methods of
+# that instance only, so there's no overhead at all while disabled.
+class EPDStats:
+    # phase name: methods timed as that phase
+    PHASES = (
+        ('reset', ('reset', 'reset_async')),
+        ('init', ('init', 'init_async')),
+        ('lut', ('set_lut', 'set_lut_bw', 'set_lut_red', 'set_lut_async')),
+        ('transfer', ('send_black_plane', 'send_red_plane', 'send_window')),
+        ('busy', ('wait_until_idle', 'wait_until_idle_async')),
+    )
+
+    def __init__(self):
+        # phase name: [count, total us, max us]
+        self.phases = {}
+        # counter name: count
+        self.counters = {}
+        self.reset()
+
+    def reset(self):
+        self.phases.clear()
+        self.counters.clear()
+        self.spi_bytes = 0
+        self.spi_writes = 0
+        self.spi_transactions = 0
+
+    def add_time(self, phase, elapsed_us):
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [1, elapsed_us, elapsed_us]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_us
+            if elapsed_us > entry[2]:
+                entry[2] = elapsed_us
+
+    def count(self, name):
+        self.counters[name] = self.counters.get(name, 0) + 1
+
+    def report(self):
+        for phase, _ in self.PHASES:
+            entry = self.phases.get(phase)
+            if entry is not None:
+                print('{:<10} {:>6} calls {:>12} us total {:>10} us max'.format(phase, entry[0], entry[1], entry[2]))
+        print('spi        {:>6} transactions {:>6} writes {:>8} bytes'.format(
+            self.spi_transactions, self.spi_writes, self.spi_bytes))
+        for name in sorted(self.counters):
+            print('{:<24} {:>8}'.format(name, self.counters[name]))
+
+    def timed(self, phase, method):
+        def wrapper(*args, **kwargs):
+            start = utime.ticks_us()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.add_time(phase, utime.ticks_diff(utime.ticks_us(), start))
+        return wrapper
+
+    def timed_async(self, phase, method):
+        async def wrapper(*args, **kwargs):
+            start = utime.ticks_us()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self.add_time(phase, utime.ticks_diff(utime.ticks_us(), start))
+        return wrapper
+
+    def counted(self, name, method):
+        counters = self.counters
+        def wrapper(*args, **kwargs):
+            counters[name] = counters.get(name, 0) + 1
+            return method(*args, **kwargs)
+        return wrapper
+
+
+class CountingSPI:
+    def __init__(self, spi, stats):
+        self.spi = spi
+        self.stats = stats
+
+    def write(self, data):
+        self.stats.spi_writes += 1
+        self.stats.spi_bytes += 1 if isinstance(data, int) else len(data)
+        return self.spi.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.spi, name)
+
+
+# Counts chip select assertions, i.e. SPI transactions
+class CountingPin:
+    def __init__(self, pin, stats):
+        self.pin = pin
+        self.stats = stats
+
+    def __call__(self, *args):
+        if args and not args[0]:
+            self.stats.spi_transactions += 1
+        return self.pin(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.pin, name)
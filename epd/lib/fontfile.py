@@ -0,0 +1,81 @@
+# Fonts stored in files, loaded a glyph at a time. The file holds:
+#  - header, HEADER_SIZE bytes: MAGIC, version, height, widest advance,
+#    flags (0), code of the first character (2 bytes) and count (2 bytes)
+#  - index, INDEX_ENTRY_SIZE bytes per character: offset of the glyph in
+#    the glyph data (3 bytes) and its width
+#  - glyph data: height rows of (width + 7) // 8 bytes per glyph, most
+#    significant bit first, like the font modules
+# Numbers are little endian. Create them with tools/fontcompile.py.
+
+MAGIC = b'EPDF'
+VERSION = 1
+HEADER_SIZE = 12
+INDEX_ENTRY_SIZE = 4
+
+
+# Drop-in replacement for font modules, e.g.
+#   font = FontFile('/flash/fonts/monaco16.epf')
+#   epd.display_string_at(frame_buffer, 0, 0, 'Hello', font, COLORED)
+# Only the header and the index are kept in memory. Glyphs are read from
+# the file into cache_size preallocated buffers, least recently used first
+# to be reused. Glyph data returned by glyph() is valid until the next call.
+class FontFile:
+    def __init__(self, path, cache_size=16, default=' '):
+        self.file = open(path, 'rb')
+        header = self.file.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE or header[0:4] != MAGIC or header[4] != VERSION:
+            self.file.close()
+            raise ValueError('not a font file')
+        self.height = header[5]
+        self.width = header[6]
+        self.first = int.from_bytes(header[8:10], 'little')
+        self.count = int.from_bytes(header[10:12], 'little')
+
+        self.index = bytearray(self.count * INDEX_ENTRY_SIZE)
+        self.file.readinto(self.index)
+        self.data_offset = HEADER_SIZE + len(self.index)
+        self.default = 0
+        self.default = self._position(default)
+
+        glyph_size = self.height * ((self.width + 7) // 8)
+        self._buffers = [bytearray(glyph_size) for _ in range(max(cache_size, 1))]
+        # character: buffer holding its glyph, least recently used first
+        self._cached = {}
+        self._order = []
+
+    def close(self):
+        self.file.close()
+
+    # Position of char in the index, or of the default character
+    def _position(self, char):
+        position = ord(char) - self.first
+        if position < 0 or position >= self.count:
+            return self.default
+        return position
+
+    def advance(self, char):
+        return self.index[self._position(char) * INDEX_ENTRY_SIZE + 3]
+
+    def glyph(self, char):
+        entry = self._position(char) * INDEX_ENTRY_SIZE
+        width = self.index[entry + 3]
+        buffer = self._cached.get(char)
+        if buffer is not None:
+            order = self._order
+            if order[-1] != char:
+                order.remove(char)
+                order.append(char)
+            return buffer, 0, width
+
+        if len(self._order) < len(self._buffers):
+            buffer = self._buffers[len(self._order)]
+        else:
+            buffer = self._cached.pop(self._order.pop(0))
+        index = self.index
+        offset = index[entry] | (index[entry + 1] << 8) | (index[entry + 2] << 16)
+        size = self.height * ((width + 7) // 8)
+        self.file.seek(self.data_offset + offset)
+        self.file.readinto(memoryview(buffer)[:size])
+        self._cached[char] = buffer
+        self._order.append(char)
+        return buffer, 0, width
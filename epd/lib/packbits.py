@@ -0,0 +1,145 @@
+# Packed 1 bit planes: a header of HEADER_SIZE bytes (MAGIC, width and
+# height, 2 bytes each, little endian), then rows of (width + 7) // 8 bytes
+# in the frame buffer layout, compressed with PackBits as one stream:
+#  - n in 0..127: the next n + 1 bytes are copied
+#  - n in 129..255: the next byte is repeated 257 - n times
+#  - 128: nothing
+# Create them with tools/frameconv.py.
+
+MAGIC = b'EPK1'
+HEADER_SIZE = 8
+
+# Compressed data is read from files this many bytes at a time
+READ_SIZE = 64
+
+# Longest repeat run, and runs of the white and black bytes that make up
+# most of a plane, copied from with slices
+MAX_RUN = 128
+_RUNS = {0x00: memoryview(bytes(MAX_RUN)), 0xFF: memoryview(b'\xff' * MAX_RUN)}
+
+
+# Reader of a packed plane held in bytes or in a file opened in binary mode.
+# It unpacks on the fly like a file holding the plane as is, so it can be
+# passed to display_frame_from_buffer() or draw_packed_at(). Seeking
+# backwards starts unpacking again from the top.
+class PackedPlane:
+    def __init__(self, source):
+        if hasattr(source, 'readinto'):
+            self.file = source
+            self._start = source.tell()
+            header = source.read(HEADER_SIZE)
+        else:
+            self.file = None
+            self._source = memoryview(source)
+            header = self._source[:HEADER_SIZE]
+        if len(header) != HEADER_SIZE or bytes(header[0:4]) != MAGIC:
+            raise ValueError('not a packed plane')
+        self.width = header[4] | (header[5] << 8)
+        self.height = header[6] | (header[7] << 8)
+        self.size = (self.width + 7) // 8 * self.height
+        if self.file is not None:
+            self._input = bytearray(READ_SIZE)
+        # run of the last other byte repeated
+        self._other_run = None
+        self._other_value = None
+        self._rewind()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+    def _rewind(self):
+        if self.file is None:
+            self._data = self._source
+            self._in_pos = HEADER_SIZE
+            self._in_end = len(self._source)
+        else:
+            self.file.seek(self._start + HEADER_SIZE)
+            self._data = memoryview(self._input)
+            self._in_pos = 0
+            self._in_end = 0
+        self._position = 0
+        # bytes left in the current run, and the repeated byte, or None
+        # while copying
+        self._run = 0
+        self._value = None
+
+    # Count of compressed bytes available, reading more from the file
+    def _available(self):
+        if self._in_pos < self._in_end:
+            return self._in_end - self._in_pos
+        if self.file is not None:
+            self._in_end = self.file.readinto(self._input)
+            self._in_pos = 0
+            if self._in_end:
+                return self._in_end
+        raise ValueError('packed plane too short')
+
+    def _next_run(self):
+        while True:
+            self._available()
+            n = self._data[self._in_pos]
+            self._in_pos += 1
+            if n < 128:
+                self._run = n + 1
+                self._value = None
+                return
+            if n > 128:
+                self._available()
+                self._run = 257 - n
+                self._value = self._data[self._in_pos]
+                self._in_pos += 1
+                return
+
+    # MAX_RUN bytes of value
+    def _repeated(self, value):
+        run = _RUNS.get(value)
+        if run is None:
+            if value != self._other_value:
+                self._other_run = memoryview(bytes((value,)) * MAX_RUN)
+                self._other_value = value
+            run = self._other_run
+        return run
+
+    def tell(self):
+        return self._position
+
+    def seek(self, position):
+        if position < self._position:
+            self._rewind()
+        while self._position < position:
+            if not self._run:
+                self._next_run()
+            n = min(self._run, position - self._position)
+            if self._value is None:
+                skipped = 0
+                while skipped < n:
+                    size = min(self._available(), n - skipped)
+                    self._in_pos += size
+                    skipped += size
+            self._run -= n
+            self._position += n
+        return self._position
+
+    # Unpacks the next bytes into buffer, returns their count
+    def readinto(self, buffer):
+        count = min(len(buffer), self.size - self._position)
+        pos = 0
+        while pos < count:
+            if not self._run:
+                self._next_run()
+            n = min(self._run, count - pos)
+            value = self._value
+            if value is None:
+                end = pos + n
+                while pos < end:
+                    size = min(self._available(), end - pos)
+                    buffer[pos:pos + size] = self._data[self._in_pos:self._in_pos + size]
+                    self._in_pos += size
+                    pos += size
+            else:
+                buffer[pos:pos + n] = self._repeated(value)[:n]
+                pos += n
+            self._run -= n
+        self._position += count
+        return count
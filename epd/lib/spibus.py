@@ -0,0 +1,111 @@
+from machine import Pin, SPI
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+
+# SPI bus shared by several devices, e.g. the display, an SD card and a
+# sensor. Every device has its own chip select pin, baudrate and SPI mode
+# (polarity and phase); the bus is reconfigured only when a transaction of
+# a device with other settings begins. Transactions are serialised with a
+# lock where threads are available.
+#   bus = SPIBus(pins=(Pin('P21'), Pin('P22'), Pin('P14')))
+#   epd = epd1in54b.EPD(reset, dc, busy, cs, bus=bus, baudrate=4000000)
+#   sensor = bus.device(Pin('P9'), baudrate=1000000, phase=1)
+#   with sensor:
+#       sensor.write_readinto(command, response)
+# An existing SPI object can be passed as spi. Give its pins as well, so
+# they are kept when the bus is reconfigured.
+class SPIBus:
+    def __init__(self, spi=None, pins=None, id=0, baudrate=1000000, polarity=0, phase=0):
+        self.pins = pins
+        if spi is None:
+            spi = SPI(id, mode=SPI.MASTER, baudrate=baudrate, polarity=polarity, phase=phase, pins=pins)
+            self._settings = (baudrate, polarity, phase)
+        else:
+            # settings of an SPI object made elsewhere are unknown
+            self._settings = None
+        self.spi = spi
+        self._lock = _thread.allocate_lock() if _thread is not None else None
+        # device holding the bus, and how many times it began a transaction
+        self._owner = None
+        self._depth = 0
+
+    def device(self, cs, baudrate=1000000, polarity=0, phase=0):
+        return SPIDevice(self, cs, baudrate, polarity, phase)
+
+    # Takes the bus for device and applies its settings. A device can take
+    # it again while holding it, it's released after as many release calls.
+    def acquire(self, device):
+        if self._owner is device:
+            self._depth += 1
+            return
+        if self._lock is not None:
+            self._lock.acquire()
+        self._owner = device
+        self._depth = 1
+        settings = device.settings
+        if settings is not None and settings != self._settings:
+            if self.pins is None:
+                self.spi.init(SPI.MASTER, baudrate=settings[0], polarity=settings[1], phase=settings[2])
+            else:
+                self.spi.init(SPI.MASTER, baudrate=settings[0], polarity=settings[1], phase=settings[2], pins=self.pins)
+            self._settings = settings
+
+    def release(self, device):
+        if self._owner is not device:
+            raise RuntimeError('SPI bus not held by this device')
+        self._depth -= 1
+        if self._depth:
+            return
+        self._owner = None
+        if self._lock is not None:
+            self._lock.release()
+
+
+# A device on an SPIBus. begin() takes the bus and selects the device,
+# end() deselects it and releases the bus; "with device:" does both.
+# settings are None for a device that uses the bus as it's configured.
+class SPIDevice:
+    def __init__(self, bus, cs, baudrate=1000000, polarity=0, phase=0):
+        self.bus = bus
+        self.spi = bus.spi
+        self.cs = cs
+        self.cs.mode(Pin.OUT)
+        self.cs(True)
+        self.settings = None if baudrate is None else (baudrate, polarity, phase)
+
+    def acquire(self):
+        self.bus.acquire(self)
+
+    def release(self):
+        self.bus.release(self)
+
+    def begin(self):
+        self.bus.acquire(self)
+        self.cs(False)
+
+    def end(self):
+        self.cs(True)
+        self.bus.release(self)
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *args):
+        self.end()
+
+    def write(self, data):
+        return self.spi.write(data)
+
+    def read(self, count, write=0):
+        return self.spi.read(count, write=write)
+
+    def readinto(self, buffer, write=0):
+        return self.spi.readinto(buffer, write=write)
+
+    def write_readinto(self, data, buffer):
+        return self.spi.write_readinto(data, buffer)
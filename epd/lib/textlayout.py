@@ -0,0 +1,123 @@
+from drawing import char_width
+
+
+# Horizontal alignment of lines
+ALIGN_LEFT = 0
+ALIGN_CENTER = 1
+ALIGN_RIGHT = 2
+
+ELLIPSIS = '...'
+
+
+def text_width(text, font):
+    if getattr(font, 'advance', None) is None and getattr(font, 'widths', None) is None:
+        return len(text) * font.width
+    width = 0
+    for char in text:
+        width += char_width(font, char)
+    return width
+
+
+# Longest prefix of text no wider than width, and its width
+def _fit(text, font, width):
+    used = 0
+    for end in range(len(text)):
+        advance = char_width(font, text[end])
+        if used + advance > width:
+            return text[:end], used
+        used += advance
+    return text, used
+
+
+# text cut to width pixels with the ellipsis appended, or just the
+# ellipsis if no text fits, or nothing if even the ellipsis doesn't
+def _ellipsize(text, font, width, ellipsis):
+    space = width - text_width(ellipsis, font)
+    if space < 0:
+        return ''
+    return _fit(text, font, space)[0].rstrip() + ellipsis
+
+
+# text as is if it fits in width pixels, cut with an ellipsis otherwise
+def truncate(text, font, width, ellipsis=ELLIPSIS):
+    if text_width(text, font) <= width:
+        return text
+    return _ellipsize(text, font, width, ellipsis)
+
+
+# Splits text into lines no wider than width pixels. Lines break at spaces
+# and at '\n', words wider than a line are broken anywhere.
+def wrap_lines(text, font, width):
+    lines = []
+    space = char_width(font, ' ')
+    for paragraph in text.split('\n'):
+        line = None
+        line_width = 0
+        for word in paragraph.split(' '):
+            word_width = text_width(word, font)
+            if line is not None and line_width + space + word_width <= width:
+                line += ' ' + word
+                line_width += space + word_width
+                continue
+            if line is not None:
+                lines.append(line)
+            while word_width > width and len(word) > 1:
+                part, part_width = _fit(word, font, width)
+                if not part:
+                    part, part_width = word[0], char_width(font, word[0])
+                lines.append(part)
+                word = word[len(part):]
+                word_width -= part_width
+            line = word
+            line_width = word_width
+        lines.append(line)
+    return lines
+
+
+# Text laid out in a box of width by height pixels: wrapped (or cut, with
+# wrap=False), aligned, and cut with an ellipsis where it doesn't fit.
+# Layout is done once, draw() can be called for every redraw.
+class TextLayout:
+    def __init__(self, text, font, width, height=None, align=ALIGN_LEFT, wrap=True,
+                 ellipsis=ELLIPSIS, line_spacing=0):
+        self.font = font
+        self.line_height = font.height + line_spacing
+        if wrap:
+            lines = wrap_lines(text, font, width)
+        else:
+            lines = [truncate(line, font, width, ellipsis) for line in text.split('\n')]
+        if height is not None:
+            count = max(0, (height + line_spacing) // self.line_height)
+            if len(lines) > count:
+                lines = lines[:count]
+                if count:
+                    lines[-1] = _ellipsize(lines[-1], font, width, ellipsis)
+
+        # (x, y, text) of every line, relative to the box
+        self.lines = []
+        # size of the text actually laid out
+        self.width = 0
+        self.height = max(0, len(lines) * self.line_height - line_spacing)
+        y = 0
+        for line in lines:
+            line_width = text_width(line, font)
+            if align == ALIGN_CENTER:
+                x = (width - line_width) // 2
+            elif align == ALIGN_RIGHT:
+                x = width - line_width
+            else:
+                x = 0
+            self.lines.append((x, y, line))
+            self.width = max(self.width, line_width)
+            y += self.line_height
+
+    # Draws the text with the top left corner of the box at (x, y).
+    # Lines and characters outside of the frame are skipped.
+    def draw(self, epd, frame_buffer, x, y, colored):
+        font = self.font
+        for line_x, line_y, line in self.lines:
+            top = y + line_y
+            if top >= epd.height:
+                break
+            if top + font.height > 0:
+                epd.display_string_at(frame_buffer, x + line_x, top, line, font, colored)
@@ -46,8 +46,9 @@ epd.sleep()
 epd.init()
 
 
-# You can import frame buffer directly:
-epd.display_frame(imagedata.IMAGE_BLACK, imagedata.IMAGE_RED)
+# You can import frame buffer directly, static screens are streamed
+# to the display as they are (see tools/frameconv.py):
+epd.display_frame_from_buffer(imagedata.IMAGE_BLACK, imagedata.IMAGE_RED)
 
 epd.clear_frame(frame_black, frame_red)
 
@@ -1,101 +1,5 @@
+# Generated by tools/fontcompile.py from monaco16.py
 width = const(10)
 height = const(16)
 
-data = 	[
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x00 (0)
-	0x00,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x01 (1)
-	0x00,0x00,0x36,0x00,0x36,0x00,0x36,0x00,0x36,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x02 (2)
-	0x00,0x00,0x11,0x00,0x11,0x00,0x11,0x00,0xff,0x80,0x22,0x00,0x22,0x00,0x22,0x00,0x22,0x00,0xff,0x80,0x44,0x00,0x44,0x00,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x03 (3)
-	0x08,0x00,0x3e,0x00,0x68,0x00,0x48,0x00,0x48,0x00,0x38,0x00,0x18,0x00,0x0e,0x00,0x0b,0x00,0x09,0x00,0x09,0x00,0x4a,0x00,0x3c,0x00,0x08,0x00,0x00,0x00,0x00,0x00, # Character 0x04 (4)
-	0x00,0x00,0x70,0x40,0x88,0x80,0x88,0x80,0x89,0x00,0x8a,0x00,0x74,0x00,0x0b,0x80,0x0c,0x40,0x14,0x40,0x24,0x40,0x44,0x40,0x83,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x05 (5)
-	0x00,0x00,0x38,0x00,0x44,0x00,0x44,0x00,0x4c,0x00,0x78,0x00,0x30,0x00,0x71,0x00,0x89,0x00,0x85,0x00,0x83,0x00,0x87,0x00,0x7c,0xc0,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x06 (6)
-	0x00,0x00,0x0e,0x00,0x0e,0x00,0x0e,0x00,0x04,0x00,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x07 (7)
-	0x03,0x00,0x0c,0x00,0x10,0x00,0x30,0x00,0x20,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x20,0x00,0x30,0x00,0x10,0x00,0x0c,0x00,0x03,0x00, # Character 0x08 (8)
-	0x60,0x00,0x18,0x00,0x04,0x00,0x06,0x00,0x02,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x02,0x00,0x06,0x00,0x04,0x00,0x18,0x00,0x60,0x00, # Character 0x09 (9)
-	0x08,0x00,0x08,0x00,0x6b,0x00,0x1c,0x00,0x1c,0x00,0x6b,0x00,0x08,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x0a (10)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x7f,0xc0,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x0b (11)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x00,0x1c,0x00,0x1c,0x00,0x04,0x00,0x08,0x00,0x10,0x00, # Character 0x0c (12)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x0d (13)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1c,0x00,0x1c,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x0e (14)
-	0x00,0x80,0x00,0x80,0x01,0x00,0x02,0x00,0x02,0x00,0x04,0x00,0x04,0x00,0x08,0x00,0x10,0x00,0x10,0x00,0x20,0x00,0x40,0x00,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x0f (15)
-	0x00,0x00,0x1c,0x00,0x23,0x00,0x41,0x80,0x41,0x80,0x42,0x80,0x44,0x80,0x48,0x80,0x48,0x80,0x50,0x80,0x60,0x80,0x21,0x00,0x1e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x10 (16)
-	0x00,0x00,0x18,0x00,0x28,0x00,0x48,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x11 (17)
-	0x00,0x00,0x3f,0x00,0x40,0x80,0x00,0x80,0x00,0x80,0x01,0x00,0x06,0x00,0x0c,0x00,0x10,0x00,0x20,0x00,0x60,0x00,0x40,0x00,0x7f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x12 (18)
-	0x00,0x00,0x3c,0x00,0x43,0x00,0x01,0x00,0x01,0x00,0x02,0x00,0x3e,0x00,0x01,0x00,0x00,0x80,0x00,0x80,0x00,0x80,0x41,0x00,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x13 (19)
-	0x00,0x00,0x02,0x00,0x06,0x00,0x0a,0x00,0x12,0x00,0x12,0x00,0x22,0x00,0x42,0x00,0x82,0x00,0xff,0xc0,0x02,0x00,0x02,0x00,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x14 (20)
-	0x00,0x00,0x7f,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x7c,0x00,0x03,0x00,0x00,0x80,0x00,0x80,0x00,0x80,0x00,0x80,0x41,0x00,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x15 (21)
-	0x00,0x00,0x1f,0x00,0x20,0x00,0x40,0x00,0xc0,0x00,0x80,0x00,0x9e,0x00,0xa1,0x00,0xc0,0x80,0xc0,0x80,0x40,0x80,0x61,0x00,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x16 (22)
-	0x00,0x00,0x7f,0x80,0x00,0x80,0x01,0x00,0x03,0x00,0x04,0x00,0x04,0x00,0x08,0x00,0x08,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x17 (23)
-	0x00,0x00,0x1f,0x00,0x61,0x80,0x40,0x80,0x40,0x80,0x21,0x00,0x1e,0x00,0x33,0x00,0x61,0x80,0x40,0x80,0x40,0x80,0x61,0x80,0x1e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x18 (24)
-	0x00,0x00,0x3e,0x00,0x43,0x00,0x81,0x00,0x81,0x80,0x81,0x80,0x42,0x80,0x3c,0x80,0x00,0x80,0x01,0x80,0x01,0x00,0x02,0x00,0x7c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x19 (25)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1c,0x00,0x1c,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1c,0x00,0x1c,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x1a (26)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1c,0x00,0x1c,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x00,0x1c,0x00,0x1c,0x00,0x04,0x00,0x08,0x00,0x10,0x00, # Character 0x1b (27)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x01,0x80,0x06,0x00,0x18,0x00,0x60,0x00,0x18,0x00,0x06,0x00,0x01,0x80,0x00,0x40,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x1c (28)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xff,0x80,0x00,0x00,0x00,0x00,0xff,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x1d (29)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x00,0x30,0x00,0x0c,0x00,0x03,0x00,0x00,0xc0,0x03,0x00,0x0c,0x00,0x30,0x00,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x1e (30)
-	0x00,0x00,0x3f,0x00,0x00,0x80,0x00,0x80,0x01,0x80,0x03,0x00,0x04,0x00,0x08,0x00,0x10,0x00,0x10,0x00,0x00,0x00,0x00,0x00,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x1f (31)
-	0x1e,0x00,0x21,0x00,0x40,0x80,0x9f,0x40,0xa1,0x40,0xa1,0x40,0xa1,0x40,0xa1,0x40,0x9f,0x80,0x80,0x00,0x40,0x00,0x22,0x00,0x1e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x20 (32)
-	0x00,0x00,0x08,0x00,0x1c,0x00,0x14,0x00,0x14,0x00,0x32,0x00,0x22,0x00,0x22,0x00,0x61,0x00,0x7f,0x00,0x41,0x00,0xc1,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x21 (33)
-	0x00,0x00,0x7f,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x7f,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x22 (34)
-	0x00,0x00,0x1f,0x00,0x20,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x20,0x00,0x1f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x23 (35)
-	0x00,0x00,0x7e,0x00,0x41,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x41,0x00,0x7e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x24 (36)
-	0x00,0x00,0x3f,0x80,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x3f,0x80,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x3f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x25 (37)
-	0x00,0x00,0x3f,0x80,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x3f,0x80,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x26 (38)
-	0x00,0x00,0x1f,0x80,0x20,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x41,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x20,0x80,0x1f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x27 (39)
-	0x00,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x7f,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x28 (40)
-	0x00,0x00,0x7f,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x29 (41)
-	0x00,0x00,0x1f,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x41,0x00,0x7e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2a (42)
-	0x00,0x00,0x41,0x00,0x42,0x00,0x44,0x00,0x48,0x00,0x50,0x00,0x60,0x00,0x50,0x00,0x48,0x00,0x44,0x00,0x42,0x00,0x41,0x00,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2b (43)
-	0x00,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x3f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2c (44)
-	0x00,0x00,0x41,0x00,0x63,0x00,0x63,0x00,0x63,0x00,0x55,0x00,0x55,0x00,0x55,0x00,0x4d,0x00,0x49,0x00,0x49,0x00,0x41,0x00,0x41,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2d (45)
-	0x00,0x00,0x40,0x80,0x60,0x80,0x60,0x80,0x50,0x80,0x50,0x80,0x48,0x80,0x44,0x80,0x44,0x80,0x42,0x80,0x43,0x80,0x41,0x80,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2e (46)
-	0x00,0x00,0x1e,0x00,0x21,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x21,0x00,0x1e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x2f (47)
-	0x00,0x00,0x7f,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x41,0x00,0x7e,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x30 (48)
-	0x00,0x00,0x1e,0x00,0x21,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x21,0x00,0x1e,0x00,0x04,0x00,0x04,0x00,0x03,0xc0, # Character 0x31 (49)
-	0x00,0x00,0x7e,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x42,0x00,0x7c,0x00,0x44,0x00,0x42,0x00,0x41,0x00,0x41,0x00,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x32 (50)
-	0x00,0x00,0x1f,0x00,0x20,0x00,0x40,0x00,0x40,0x00,0x60,0x00,0x30,0x00,0x0c,0x00,0x03,0x00,0x00,0x80,0x00,0x80,0x01,0x00,0x7e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x33 (51)
-	0x00,0x00,0xff,0x80,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x34 (52)
-	0x00,0x00,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x40,0x80,0x3f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x35 (53)
-	0x00,0x00,0x80,0x80,0xc0,0x80,0x41,0x00,0x41,0x00,0x63,0x00,0x22,0x00,0x22,0x00,0x36,0x00,0x14,0x00,0x14,0x00,0x1c,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x36 (54)
-	0x00,0x00,0x88,0x80,0x88,0x80,0x88,0x80,0x55,0x00,0x55,0x00,0x55,0x00,0x55,0x00,0x55,0x00,0x77,0x00,0x63,0x00,0x22,0x00,0x22,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x37 (55)
-	0x00,0x00,0x21,0x00,0x22,0x00,0x12,0x00,0x14,0x00,0x0c,0x00,0x08,0x00,0x0c,0x00,0x14,0x00,0x22,0x00,0x22,0x00,0x41,0x00,0x41,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x38 (56)
-	0x00,0x00,0x40,0x40,0x20,0x80,0x20,0x80,0x11,0x00,0x0a,0x00,0x0a,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x39 (57)
-	0x00,0x00,0x7f,0x80,0x00,0x80,0x01,0x00,0x02,0x00,0x02,0x00,0x04,0x00,0x08,0x00,0x10,0x00,0x10,0x00,0x20,0x00,0x40,0x00,0x7f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x3a (58)
-	0x3f,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x3f,0x00, # Character 0x3b (59)
-	0x20,0x00,0x20,0x00,0x10,0x00,0x10,0x00,0x08,0x00,0x04,0x00,0x04,0x00,0x02,0x00,0x02,0x00,0x01,0x00,0x01,0x00,0x00,0x80,0x00,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x3c (60)
-	0xfc,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0x04,0x00,0xfc,0x00, # Character 0x3d (61)
-	0x00,0x00,0x00,0x00,0x0c,0x00,0x0c,0x00,0x12,0x00,0x12,0x00,0x21,0x00,0x21,0x00,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x3e (62)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xff,0x80,0x00,0x00,0x00,0x00, # Character 0x3f (63)
-	0x08,0x00,0x04,0x00,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x40 (64)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1f,0x00,0x21,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x43,0x00,0x3d,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x41 (65)
-	0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x5e,0x00,0x61,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x42,0x00,0x7c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x42 (66)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1e,0x00,0x21,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x20,0x00,0x1f,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x43 (67)
-	0x00,0x80,0x00,0x80,0x00,0x80,0x00,0x80,0x0f,0x80,0x10,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x21,0x80,0x1e,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x44 (68)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1e,0x00,0x21,0x00,0x41,0x00,0x41,0x00,0x7f,0x00,0x40,0x00,0x40,0x00,0x21,0x00,0x1e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x45 (69)
-	0x03,0xc0,0x04,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x7f,0x80,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x46 (70)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0f,0x80,0x10,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x21,0x80,0x1e,0x80,0x00,0x80,0x21,0x00,0x1e,0x00, # Character 0x47 (71)
-	0x40,0x00,0x40,0x00,0x40,0x00,0x40,0x00,0x5e,0x00,0x61,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x48 (72)
-	0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x70,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x49 (73)
-	0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1f,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x01,0x00,0x02,0x00,0x3c,0x00, # Character 0x4a (74)
-	0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x21,0x00,0x22,0x00,0x24,0x00,0x28,0x00,0x30,0x00,0x28,0x00,0x24,0x00,0x22,0x00,0x21,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x4b (75)
-	0x70,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x10,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x4c (76)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xb3,0x00,0xcc,0x80,0x88,0x80,0x88,0x80,0x88,0x80,0x88,0x80,0x88,0x80,0x88,0x80,0x88,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x4d (77)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x5e,0x00,0x61,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x4e (78)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1c,0x00,0x22,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x22,0x00,0x1c,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x4f (79)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x5e,0x00,0x61,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x41,0x00,0x42,0x00,0x7c,0x00,0x40,0x00,0x40,0x00,0x40,0x00, # Character 0x50 (80)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0f,0x80,0x10,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x21,0x80,0x1e,0x80,0x00,0x80,0x00,0x80,0x00,0x80, # Character 0x51 (81)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x2f,0x80,0x30,0x80,0x20,0x80,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x52 (82)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x3c,0x00,0x42,0x00,0x40,0x00,0x20,0x00,0x1c,0x00,0x02,0x00,0x01,0x00,0x41,0x00,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x53 (83)
-	0x00,0x00,0x00,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x3f,0x80,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x07,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x54 (84)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x20,0x80,0x21,0x80,0x1e,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x55 (85)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x40,0x40,0x40,0x20,0x80,0x20,0x80,0x11,0x00,0x11,0x00,0x0a,0x00,0x0a,0x00,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x56 (86)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x88,0x80,0x88,0x80,0x94,0x80,0x55,0x00,0x55,0x00,0x55,0x00,0x55,0x00,0x22,0x00,0x22,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x57 (87)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x41,0x00,0x22,0x00,0x14,0x00,0x08,0x00,0x08,0x00,0x14,0x00,0x22,0x00,0x22,0x00,0x41,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x58 (88)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x41,0x00,0x41,0x00,0x21,0x00,0x22,0x00,0x12,0x00,0x14,0x00,0x0c,0x00,0x0c,0x00,0x08,0x00,0x08,0x00,0x10,0x00,0xe0,0x00, # Character 0x59 (89)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7f,0x80,0x01,0x80,0x03,0x00,0x06,0x00,0x0c,0x00,0x18,0x00,0x30,0x00,0x60,0x00,0x7f,0x80,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x5a (90)
-	0x07,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x30,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x07,0x00, # Character 0x5b (91)
-	0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x5c (92)
-	0x70,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x06,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x08,0x00,0x70,0x00, # Character 0x5d (93)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x38,0x80,0x4c,0x80,0x47,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x5e (94)
-	0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00, # Character 0x5f (95)
-]
+data = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x006\x006\x006\x006\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x00\x11\x00\x11\x00\xff\x80"\x00"\x00"\x00"\x00\xff\x80D\x00D\x00D\x00\x00\x00\x00\x00\x00\x00\x08\x00>\x00h\x00H\x00H\x008\x00\x18\x00\x0e\x00\x0b\x00\t\x00\t\x00J\x00<\x00\x08\x00\x00\x00\x00\x00\x00\x00p@\x88\x80\x88\x80\x89\x00\x8a\x00t\x00\x0b\x80\x0c@\x14@$@D@\x83\x80\x00\x00\x00\x00\x00\x00\x00\x008\x00D\x00D\x00L\x00x\x000\x00q\x00\x89\x00\x85\x00\x83\x00\x87\x00|\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x0e\x00\x0e\x00\x04\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x0c\x00\x10\x000\x00 \x00@\x00@\x00@\x00@\x00@\x00@\x00 \x000\x00\x10\x00\x0c\x00\x03\x00`\x00\x18\x00\x04\x00\x06\x00\x02\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x02\x00\x06\x00\x04\x00\x18\x00`\x00\x08\x00\x08\x00k\x00\x1c\x00\x1c\x00k\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x04\x00\x04\x00\x04\x00\x7f\xc0\x04\x00\x04\x00\x04\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x1c\x00\x1c\x00\x04\x00\x08\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x1c\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x80\x01\x00\x02\x00\x02\x00\x04\x00\x04\x00\x08\x00\x10\x00\x10\x00 \x00@\x00@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00#\x00A\x80A\x80B\x80D\x80H\x80H\x80P\x80`\x80!\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00(\x00H\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x00@\x80\x00\x80\x00\x80\x01\x00\x06\x00\x0c\x00\x10\x00 \x00`\x00@\x00\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00<\x00C\x00\x01\x00\x01\x00\x02\x00>\x00\x01\x00\x00\x80\x00\x80\x00\x80A\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x06\x00\n\x00\x12\x00\x12\x00"\x00B\x00\x82\x00\xff\xc0\x02\x00\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00@\x00@\x00@\x00|\x00\x03\x00\x00\x80\x00\x80\x00\x80\x00\x80A\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00 \x00@\x00\xc0\x00\x80\x00\x9e\x00\xa1\x00\xc0\x80\xc0\x80@\x80a\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80\x00\x80\x01\x00\x03\x00\x04\x00\x04\x00\x08\x00\x08\x00\x10\x00\x10\x00\x10\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00a\x80@\x80@\x80!\x00\x1e\x003\x00a\x80@\x80@\x80a\x80\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00C\x00\x81\x00\x81\x80\x81\x80B\x80<\x80\x00\x80\x01\x80\x01\x00\x02\x00|\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x1c\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x1c\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x1c\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x18\x00\x1c\x00\x1c\x00\x04\x00\x08\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00@\x01\x80\x06\x00\x18\x00`\x00\x18\x00\x06\x00\x01\x80\x00@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\x00\x00\x00\x00\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00@\x000\x00\x0c\x00\x03\x00\x00\xc0\x03\x00\x0c\x000\x00@\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x00\x00\x80\x00\x80\x01\x80\x03\x00\x04\x00\x08\x00\x10\x00\x10\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x1e\x00!\x00@\x80\x9f@\xa1@\xa1@\xa1@\xa1@\x9f\x80\x80\x00@\x00"\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x1c\x00\x14\x00\x14\x002\x00"\x00"\x00a\x00\x7f\x00A\x00\xc1\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00@\x80@\x80@\x80@\x80\x7f\x00@\x80@\x80@\x80@\x80@\x80\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00 \x00@\x00@\x00@\x00@\x00@\x00@\x00@\x00@\x00 \x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00A\x00@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80A\x00~\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x80 \x00 \x00 \x00 \x00?\x80 \x00 \x00 \x00 \x00 \x00?\x80\x00\x00\x00\x00\x00\x00\x00\x00?\x80 \x00 \x00 \x00 \x00?\x80 \x00 \x00 \x00 \x00 \x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x80 \x00@\x00@\x00@\x00@\x00A\x80@\x80@\x80@\x80 \x80\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00@\x80@\x80@\x80@\x80@\x80\x7f\x80@\x80@\x80@\x80@\x80@\x80@\x80\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00A\x00~\x00\x00\x00\x00\x00\x00\x00\x00\x00A\x00B\x00D\x00H\x00P\x00`\x00P\x00H\x00D\x00B\x00A\x00@\x80\x00\x00\x00\x00\x00\x00\x00\x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00?\x80\x00\x00\x00\x00\x00\x00\x00\x00A\x00c\x00c\x00c\x00U\x00U\x00U\x00M\x00I\x00I\x00A\x00A\x00\x00\x00\x00\x00\x00\x00\x00\x00@\x80`\x80`\x80P\x80P\x80H\x80D\x80D\x80B\x80C\x80A\x80@\x80\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x00!\x00@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80!\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00@\x80@\x80@\x80@\x80A\x00~\x00@\x00@\x00@\x00@\x00@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x00!\x00@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80!\x00\x1e\x00\x04\x00\x04\x00\x03\xc0\x00\x00~\x00A\x00A\x00A\x00A\x00B\x00|\x00D\x00B\x00A\x00A\x00@\x80\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00 \x00@\x00@\x00`\x000\x00\x0c\x00\x03\x00\x00\x80\x00\x80\x01\x00~\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80@\x80?\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\xc0\x80A\x00A\x00c\x00"\x00"\x006\x00\x14\x00\x14\x00\x1c\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x80\x88\x80\x88\x80U\x00U\x00U\x00U\x00U\x00w\x00c\x00"\x00"\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x00"\x00\x12\x00\x14\x00\x0c\x00\x08\x00\x0c\x00\x14\x00"\x00"\x00A\x00A\x00\x00\x00\x00\x00\x00\x00\x00\x00@@ \x80 \x80\x11\x00\n\x00\n\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80\x00\x80\x01\x00\x02\x00\x02\x00\x04\x00\x08\x00\x10\x00\x10\x00 \x00@\x00\x7f\x80\x00\x00\x00\x00\x00\x00?\x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00 \x00?\x00 \x00 \x00\x10\x00\x10\x00\x08\x00\x04\x00\x04\x00\x02\x00\x02\x00\x01\x00\x01\x00\x00\x80\x00\x80\x00\x00\x00\x00\x00\x00\xfc\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\x04\x00\xfc\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x12\x00\x12\x00!\x00!\x00@\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\x00\x00\x00\x00\x08\x00\x04\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00!\x00A\x00A\x00A\x00A\x00A\x00C\x00=\x00\x00\x00\x00\x00\x00\x00@\x00@\x00@\x00@\x00^\x00a\x00A\x00A\x00A\x00A\x00A\x00B\x00|\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x00!\x00@\x00@\x00@\x00@\x00@\x00 \x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x80\x00\x80\x00\x80\x0f\x80\x10\x80 \x80 \x80 \x80 \x80 \x80!\x80\x1e\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x00!\x00A\x00A\x00\x7f\x00@\x00@\x00!\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x04\x00\x08\x00\x08\x00\x08\x00\x7f\x80\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x10\x80 \x80 \x80 \x80 \x80 \x80!\x80\x1e\x80\x00\x80!\x00\x1e\x00@\x00@\x00@\x00@\x00^\x00a\x00A\x00A\x00A\x00A\x00A\x00A\x00A\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00p\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x02\x00<\x00 \x00 \x00 \x00 \x00!\x00"\x00$\x00(\x000\x00(\x00$\x00"\x00!\x00\x00\x00\x00\x00\x00\x00p\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x00\xcc\x80\x88\x80\x88\x80\x88\x80\x88\x80\x88\x80\x88\x80\x88\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00^\x00a\x00A\x00A\x00A\x00A\x00A\x00A\x00A\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00"\x00A\x00A\x00A\x00A\x00A\x00"\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00^\x00a\x00A\x00A\x00A\x00A\x00A\x00B\x00|\x00@\x00@\x00@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x10\x80 \x80 \x80 \x80 \x80 \x80!\x80\x1e\x80\x00\x80\x00\x80\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00/\x800\x80 \x80 \x00 \x00 \x00 \x00 \x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00<\x00B\x00@\x00 \x00\x1c\x00\x02\x00\x01\x00A\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x08\x00\x08\x00?\x80\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \x80 \x80 \x80 \x80 \x80 \x80 \x80!\x80\x1e\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00@@@@ \x80 \x80\x11\x00\x11\x00\n\x00\n\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x80\x88\x80\x94\x80U\x00U\x00U\x00U\x00"\x00"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00A\x00"\x00\x14\x00\x08\x00\x08\x00\x14\x00"\x00"\x00A\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00A\x00A\x00!\x00"\x00\x12\x00\x14\x00\x0c\x00\x0c\x00\x08\x00\x08\x00\x10\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00\x7f\x80\x00\x00\x00\x00\x00\x00\x07\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x000\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x07\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00p\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x06\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00p\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x80L\x80G\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# Host-side benchmark, runs on CPython. Times the drawing primitives of
+# epd1in54b.EPD, text in every font module in frozen/, draw_bmp_at with the
+# images in epd/gfx and display_frame, in all four rotations, with the
+# stand-ins for machine, utime and pycom in tools/host, e.g.
+#   python3 tools/bench.py
+#   python3 tools/bench.py --save baseline.json
+#   python3 tools/bench.py --json results.json --compare baseline.json
+#   python3 tools/bench.py --filter text --logical
+# Each case is timed in rounds of enough calls to last --min-time seconds
+# of CPU time, the fastest round counts. Peak allocations are measured with
+# tracemalloc over one call. They count CPython objects, so they only
+# compare with other runs on the host, but grow with what the code
+# allocates on device. Sleeps return at once, the time they would take is
+# reported as slept_ms.
+#
+# --save writes the results as a baseline, --compare reports cases slower
+# than the baseline by more than --tolerance, or allocating more than
+# --alloc-tolerance bytes over it, and then exits with status 1. Cases that
+# look slower are timed again up to --retries times, the fastest time
+# counts, so that a busy host alone doesn't fail the comparison. Timings
+# depend on the host: save a baseline on the machine you compare on, no
+# baseline is kept in the repository.
+
+import argparse
+import builtins
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_DIR = os.path.join(ROOT, 'tools', 'host')
+LIB_DIR = os.path.join(ROOT, 'epd', 'lib')
+FROZEN_DIR = os.path.join(ROOT, 'frozen')
+GFX_DIR = os.path.join(ROOT, 'epd', 'gfx')
+
+ROTATIONS = (0, 90, 180, 270)
+TEXT = 'The quick brown fox 0123'
+
+
+def setup_path():
+    sys.path[:0] = [HOST_DIR, LIB_DIR, FROZEN_DIR]
+    # const() is a builtin on MicroPython, the fonts use it
+    if not hasattr(builtins, 'const'):
+        builtins.const = lambda value: value
+
+
+def load_fonts():
+    import importlib
+    fonts = []
+    for path in sorted(glob.glob(os.path.join(FROZEN_DIR, '*.py'))):
+        module = importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+        if hasattr(module, 'height') and hasattr(module, 'data'):
+            fonts.append(module)
+    return fonts
+
+
+def create_epd():
+    import epd1in54b
+    from machine import Pin
+    busy = Pin('P18', value=1 - epd1in54b.EPD.BUSY_LEVEL)
+    epd = epd1in54b.EPD(Pin('P19'), Pin('P20'), busy, Pin('P4'), Pin('P21'), Pin('P22'))
+    epd.init()
+    return epd
+
+
+# Cases as (name, function of epd, black buffer and red buffer)
+def build_cases(fonts, images):
+    from epd1in54b import COLORED
+
+    def set_pixel(epd, black, red):
+        for i in range(500):
+            epd.set_pixel(black, (i * 7) % 200, (i * 13) % 200, COLORED)
+
+    def lines(epd, black, red):
+        for i in range(0, 200, 25):
+            epd.draw_line(black, 0, i, 199, 199 - i, COLORED)
+            epd.draw_line(black, i, 0, 199 - i, 199, COLORED)
+
+    def thick_lines(epd, black, red):
+        for i in range(0, 200, 50):
+            epd.draw_line(black, 0, i, 199, 199 - i, COLORED, 5)
+
+    def spans(epd, black, red):
+        for i in range(0, 200, 10):
+            epd.draw_horizontal_line(black, i // 2, i, 150, COLORED)
+            epd.draw_vertical_line(black, i, i // 2, 150, COLORED)
+
+    def rectangles(epd, black, red):
+        for i in range(0, 100, 10):
+            epd.draw_rectangle(black, i, i, 199 - i, 199 - i, COLORED)
+
+    def filled_rectangles(epd, black, red):
+        epd.draw_filled_rectangle(black, 0, 0, 199, 199, COLORED)
+        epd.draw_filled_rectangle(red, 13, 27, 141, 180, COLORED)
+
+    def circles(epd, black, red):
+        for radius in range(10, 100, 10):
+            epd.draw_circle(black, 100, 100, radius, COLORED)
+
+    def filled_circles(epd, black, red):
+        epd.draw_filled_circle(black, 100, 100, 95, COLORED)
+        epd.draw_filled_circle(red, 60, 140, 40, COLORED)
+
+    def display_frame(epd, black, red):
+        epd.display_frame(black, red, force=True)
+
+    cases = [
+        ('set_pixel', set_pixel),
+        ('lines', lines),
+        ('thick_lines', thick_lines),
+        ('spans', spans),
+        ('rectangles', rectangles),
+        ('filled_rectangles', filled_rectangles),
+        ('circles', circles),
+        ('filled_circles', filled_circles),
+    ]
+    for font in fonts:
+        cases.append(('text_' + font.__name__, text_case(font, COLORED)))
+    for path in images:
+        name = os.path.splitext(os.path.basename(path))[0]
+        cases.append(('bmp_' + name, bmp_case(path, COLORED)))
+    cases.append(('display_frame', display_frame))
+    return cases
+
+
+def text_case(font, colored):
+    def case(epd, black, red):
+        for y in range(0, epd.height - font.height, font.height * 2):
+            epd.display_string_at(black, 0, y, TEXT, font, colored)
+    return case
+
+
+def bmp_case(path, colored):
+    def case(epd, black, red):
+        epd.draw_bmp_at(black, 0, 0, path, colored)
+    return case
+
+
+# CPU seconds per call: the fastest of repeat rounds of number calls, with
+# number doubled until a round lasts min_time
+def time_case(call, repeat, min_time):
+    number = 1
+    while True:
+        start = time.process_time()
+        for _ in range(number):
+            call()
+        elapsed = time.process_time() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.process_time()
+        for _ in range(number):
+            call()
+        best = min(best, time.process_time() - start)
+    return best / number, number
+
+
+def peak_allocation(call):
+    tracemalloc.start()
+    try:
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        call()
+        return tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+
+# Results of the cases matching args.filter, or only of keys if given
+def run(args, keys=None):
+    import utime
+    fonts = load_fonts()
+    images = sorted(glob.glob(os.path.join(GFX_DIR, '*.bmp')))
+    epd = create_epd()
+    epd.set_logical_buffers(args.logical)
+    size = epd.width * epd.height // 8
+    black = bytearray(size)
+    red = bytearray(size)
+    results = {}
+    for name, function in build_cases(fonts, images):
+        if args.filter and not any(pattern in name for pattern in args.filter):
+            continue
+        for rotation in ROTATIONS:
+            key = '{}/rot{}'.format(name, rotation)
+            if keys is not None and key not in keys:
+                continue
+            epd.set_rotate(ROTATIONS.index(rotation))
+            epd.clear_frame(black, red)
+
+            def call():
+                function(epd, black, red)
+
+            # once first, so that imports and caches are not measured
+            call()
+            slept_ms = utime.slept_ms
+            call()
+            slept_ms = utime.slept_ms - slept_ms
+            seconds, number = time_case(call, args.repeat, args.min_time)
+            results[key] = {
+                'us': round(seconds * 1000000, 1),
+                'calls': number,
+                'peak_bytes': peak_allocation(call),
+                'slept_ms': slept_ms,
+            }
+            if not args.quiet:
+                print('{:<28} {:>12.1f} us {:>10} bytes peak'.format(key, seconds * 1000000, results[key]['peak_bytes']))
+    return results
+
+
+# Regressions as (key, message), and baseline keys that weren't run
+def compare(results, baseline, tolerance, alloc_tolerance):
+    regressions = []
+    for key, result in sorted(results.items()):
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = result['us'] / base['us'] if base['us'] else 1.0
+        if ratio > 1 + tolerance:
+            regressions.append((key, '{}: {:.1f} us, baseline {:.1f} us ({:+.0%})'.format(key, result['us'], base['us'], ratio - 1)))
+        if result['peak_bytes'] > base['peak_bytes'] + alloc_tolerance:
+            regressions.append((key, '{}: {} bytes peak, baseline {} bytes'.format(key, result['peak_bytes'], base['peak_bytes'])))
+    missing = sorted(set(baseline) - set(results))
+    return regressions, missing
+
+
+# Times the cases of regressions again, keeping the fastest time and the
+# lowest peak of every case
+def retry(args, results, regressions):
+    keys = set(key for key, message in regressions)
+    for key, result in run(args, keys).items():
+        best = results[key]
+        if result['us'] < best['us']:
+            best['us'] = result['us']
+            best['calls'] = result['calls']
+        best['peak_bytes'] = min(best['peak_bytes'], result['peak_bytes'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the e-Paper library on the host')
+    parser.add_argument('--filter', action='append', help='only run cases whose name contains this, may be repeated')
+    parser.add_argument('--logical', action='store_true', help='use buffers in logical orientation')
+    parser.add_argument('--repeat', type=int, default=5, help='rounds per case, the fastest counts')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum length of a round, in seconds')
+    parser.add_argument('--json', help='write the results as JSON to this file, - for standard output')
+    parser.add_argument('--save', help='write the results as a baseline to this file')
+    parser.add_argument('--compare', help='baseline to compare the results with')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='slowdown over the baseline reported as a regression')
+    parser.add_argument('--alloc-tolerance', type=int, default=256, help='bytes over the baseline peak reported as a regression')
+    parser.add_argument('--retries', type=int, default=3, help='times cases slower than the baseline are timed again')
+    parser.add_argument('--quiet', action='store_true', help='do not print results as they come')
+    args = parser.parse_args()
+
+    setup_path()
+    results = run(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as source:
+            baseline = json.load(source)
+        for _ in range(args.retries):
+            regressions = compare(results, baseline['results'], args.tolerance, args.alloc_tolerance)[0]
+            if not regressions:
+                break
+            retry(args, results, regressions)
+
+    document = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'logical_buffers': args.logical,
+        'results': results,
+    }
+    if args.json == '-':
+        json.dump(document, sys.stdout, indent=1, sort_keys=True)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as output:
+            json.dump(document, output, indent=1, sort_keys=True)
+    if args.save:
+        with open(args.save, 'w') as output:
+            json.dump(document, output, indent=1, sort_keys=True)
+            output.write('\n')
+
+    if baseline is not None:
+        if baseline.get('logical_buffers', False) != args.logical:
+            print('warning: baseline was run {} logical buffers'.format('with' if baseline.get('logical_buffers') else 'without'), file=sys.stderr)
+        regressions, missing = compare(results, baseline['results'], args.tolerance, args.alloc_tolerance)
+        for key in missing:
+            if not args.filter:
+                print('not run: {}'.format(key), file=sys.stderr)
+        for key, regression in regressions:
+            print('regression: {}'.format(regression), file=sys.stderr)
+        if regressions:
+            return 1
+        print('no regressions against {}'.format(args.compare), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# Host-side font compiler, runs on CPython. Reads BDF fonts, TrueType fonts
+# (needs Pillow) or the font modules in frozen/, and writes either a font
+# module to copy or freeze, or a font file for epd/lib/fontfile.py, e.g.
+#   python3 tools/fontcompile.py frozen/monaco16.py monaco16.py
+#   python3 tools/fontcompile.py --proportional frozen/font24.py font24p.py
+#   python3 tools/fontcompile.py --size 18 DejaVuSans.ttf dejavu18.py
+#   python3 tools/fontcompile.py helvR12.bdf helv12.epf
+#
+# Font modules hold width, height and data like the ones in frozen/. Fonts
+# with glyphs of different widths also hold:
+#  - first: code of the first character
+#  - widths: advance of every glyph, one byte each
+#  - offsets: position of every glyph in data, 2 bytes each, little endian
+# Glyphs are height rows of (width + 7) // 8 bytes, most significant bit first.
+
+import argparse
+import os
+import sys
+
+MAGIC = b'EPDF'
+VERSION = 1
+
+
+# A font as a list of glyphs for consecutive characters from first on,
+# every glyph being (width, rows) with rows holding height ints of width
+# bits, the leftmost pixel in the highest bit
+class Font:
+    def __init__(self, height, first, glyphs):
+        self.height = height
+        self.first = first
+        self.glyphs = glyphs
+
+    @property
+    def width(self):
+        return max(width for width, _ in self.glyphs)
+
+    @property
+    def fixed_width(self):
+        return all(width == self.glyphs[0][0] for width, _ in self.glyphs)
+
+
+def pack_glyph(width, rows):
+    row_bytes = (width + 7) // 8
+    data = bytearray()
+    for row in rows:
+        data += (row << (row_bytes * 8 - width)).to_bytes(row_bytes, 'big')
+    return bytes(data)
+
+
+def unpack_glyph(width, height, data):
+    row_bytes = (width + 7) // 8
+    rows = []
+    for y in range(height):
+        row = int.from_bytes(data[y * row_bytes:(y + 1) * row_bytes], 'big')
+        rows.append(row >> (row_bytes * 8 - width))
+    return rows
+
+
+def read_module(path):
+    namespace = {'const': lambda value: value}
+    with open(path) as source:
+        exec(compile(source.read(), path, 'exec'), namespace)
+    height = namespace['height']
+    data = bytes(namespace['data'])
+    if 'widths' in namespace:
+        widths = namespace['widths']
+        offsets = namespace['offsets']
+        glyphs = []
+        for i, width in enumerate(widths):
+            offset = offsets[2 * i] | (offsets[2 * i + 1] << 8)
+            glyphs.append((width, unpack_glyph(width, height, data[offset:])))
+        return Font(height, namespace['first'], glyphs)
+    width = namespace['width']
+    size = height * ((width + 7) // 8)
+    glyphs = [(width, unpack_glyph(width, height, data[offset:offset + size]))
+              for offset in range(0, len(data) - size + 1, size)]
+    return Font(height, ord(' '), glyphs)
+
+
+# Row of a cell width pixels wide holding a bitmap row placed at column x,
+# clipping what falls outside
+def _fit_row(bits, bitmap_width, x, width):
+    row = 0
+    for i in range(bitmap_width):
+        if bits & (1 << (bitmap_width - 1 - i)):
+            column = x + i
+            if 0 <= column < width:
+                row |= 1 << (width - 1 - column)
+    return row
+
+
+def read_bdf(path, first, last):
+    ascent = descent = None
+    glyphs = {}
+    with open(path) as source:
+        lines = iter(source.read().splitlines())
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == 'FONT_ASCENT':
+            ascent = int(fields[1])
+        elif fields[0] == 'FONT_DESCENT':
+            descent = int(fields[1])
+        elif fields[0] == 'FONTBOUNDINGBOX' and ascent is None:
+            descent = -int(fields[4])
+            ascent = int(fields[2]) - descent
+        elif fields[0] == 'STARTCHAR':
+            code = advance = None
+            box = (0, 0, 0, 0)
+            bitmap = []
+            for line in lines:
+                fields = line.split()
+                if not fields:
+                    continue
+                if fields[0] == 'ENCODING':
+                    code = int(fields[1])
+                elif fields[0] == 'DWIDTH':
+                    advance = int(fields[1])
+                elif fields[0] == 'BBX':
+                    box = tuple(int(field) for field in fields[1:5])
+                elif fields[0] == 'BITMAP':
+                    for line in lines:
+                        if line.strip() == 'ENDCHAR':
+                            break
+                        bits = int(line.strip(), 16)
+                        bitmap.append(bits >> (len(line.strip()) * 4 - box[0]))
+                    break
+            if code is not None and first <= code <= last:
+                glyphs[code] = (advance if advance is not None else box[0], box, bitmap)
+    if ascent is None:
+        raise ValueError('{}: no font ascent'.format(path))
+    height = ascent + descent
+    result = []
+    for code in range(first, last + 1):
+        if code not in glyphs:
+            result.append((glyphs[ord(' ')][0] if ord(' ') in glyphs else 0, [0] * height))
+            continue
+        advance, (box_width, box_height, x, y), bitmap = glyphs[code]
+        top = ascent - y - box_height
+        rows = [0] * height
+        for j, bits in enumerate(bitmap):
+            if 0 <= top + j < height:
+                rows[top + j] = _fit_row(bits, box_width, x, advance)
+        result.append((advance, rows))
+    return Font(height, first, result)
+
+
+def read_truetype(path, size, first, last):
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        raise SystemExit('TrueType fonts need Pillow: pip install Pillow')
+    font = ImageFont.truetype(path, size)
+    ascent, descent = font.getmetrics()
+    height = ascent + descent
+    glyphs = []
+    for code in range(first, last + 1):
+        char = chr(code)
+        width = int(round(font.getlength(char)))
+        rows = [0] * height
+        if width:
+            image = Image.new('1', (width, height), 0)
+            ImageDraw.Draw(image).text((0, 0), char, font=font, fill=1)
+            pixels = image.load()
+            for y in range(height):
+                for x in range(width):
+                    if pixels[x, y]:
+                        rows[y] |= 1 << (width - 1 - x)
+        glyphs.append((width, rows))
+    return Font(height, first, glyphs)
+
+
+# Crops the blank columns around every glyph and appends spacing blank
+# columns, turning a fixed width font into a proportional one
+def make_proportional(font, spacing):
+    glyphs = []
+    for width, rows in font.glyphs:
+        ink = 0
+        for row in rows:
+            ink |= row
+        if not ink:
+            # blank glyphs like the space keep half of their width
+            glyphs.append((max(1, width // 2), [0] * font.height))
+            continue
+        right = (ink & -ink).bit_length() - 1
+        left = width - ink.bit_length()
+        new_width = width - left - right + spacing
+        glyphs.append((new_width, [(row >> right) << spacing for row in rows]))
+    return Font(font.height, font.first, glyphs)
+
+
+def write_module(font, path, source):
+    lines = ['# Generated by tools/fontcompile.py from {}'.format(os.path.basename(source))]
+    lines.append('width = const({})'.format(font.width))
+    lines.append('height = const({})'.format(font.height))
+    data = bytearray()
+    if font.fixed_width and font.first == ord(' '):
+        for width, rows in font.glyphs:
+            data += pack_glyph(width, rows)
+    else:
+        widths = bytearray()
+        offsets = bytearray()
+        for width, rows in font.glyphs:
+            if width > 255:
+                raise ValueError('glyph too wide')
+            widths.append(width)
+            offsets += len(data).to_bytes(2, 'little')
+            data += pack_glyph(width, rows)
+        if len(data) > 0xFFFF:
+            raise ValueError('font too large for a module, write a font file instead')
+        lines.append('first = const({})'.format(font.first))
+        lines.append('')
+        lines.append('widths = {!r}'.format(bytes(widths)))
+        lines.append('offsets = {!r}'.format(bytes(offsets)))
+    lines.append('')
+    lines.append('data = {!r}'.format(bytes(data)))
+    with open(path, 'w') as output:
+        output.write('\n'.join(lines) + '\n')
+
+
+def write_font_file(font, path):
+    index = bytearray()
+    data = bytearray()
+    for width, rows in font.glyphs:
+        if width > 255:
+            raise ValueError('glyph too wide')
+        index += len(data).to_bytes(3, 'little') + bytes([width])
+        data += pack_glyph(width, rows)
+    if len(data) >= 1 << 24:
+        raise ValueError('font too large')
+    header = (MAGIC + bytes([VERSION, font.height, font.width, 0])
+              + font.first.to_bytes(2, 'little') + len(font.glyphs).to_bytes(2, 'little'))
+    with open(path, 'wb') as output:
+        output.write(header + index + data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert fonts for the e-Paper library')
+    parser.add_argument('source', help='font module (.py), BDF (.bdf) or TrueType (.ttf, .otf) font')
+    parser.add_argument('output', help='font module (.py) or font file (.epf) to write')
+    parser.add_argument('--size', type=int, default=16, help='pixel size of TrueType fonts')
+    parser.add_argument('--first', type=int, default=32, help='first character code, for BDF and TrueType fonts')
+    parser.add_argument('--last', type=int, default=126, help='last character code, for BDF and TrueType fonts')
+    parser.add_argument('--proportional', action='store_true', help='crop blank columns around glyphs')
+    parser.add_argument('--spacing', type=int, default=1, help='columns between proportional glyphs')
+    args = parser.parse_args()
+
+    extension = os.path.splitext(args.source)[1].lower()
+    if extension == '.py':
+        font = read_module(args.source)
+    elif extension == '.bdf':
+        font = read_bdf(args.source, args.first, args.last)
+    elif extension in ('.ttf', '.otf'):
+        font = read_truetype(args.source, args.size, args.first, args.last)
+    else:
+        parser.error('unknown font format: {}'.format(args.source))
+    if args.proportional:
+        font = make_proportional(font, args.spacing)
+
+    if args.output.lower().endswith('.py'):
+        write_module(font, args.output, args.source)
+    else:
+        write_font_file(font, args.output)
+    print('{}: {} glyphs, {}x{}, {} bytes'.format(
+        args.output, len(font.glyphs), font.width, font.height, os.path.getsize(args.output)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# Host-side frame converter, runs on CPython. Converts a static screen to
+# raw planes in the frame buffer layout (1 bit per pixel, rows of WIDTH
+# pixels, most significant bit first, 0 meaning colored), either as plane
+# files for EPD.display_frame_from_file() or as a module of bytes to copy
+# or freeze, for EPD.display_frame_from_buffer(), e.g.
+#   python3 tools/frameconv.py frozen/imagedata.py splash.py
+#   python3 tools/frameconv.py splash.png /tmp/splash
+# writes splash.py, or /tmp/splash_b.bin and /tmp/splash_r.bin.
+#
+# With --packed, planes are compressed with PackBits (see
+# epd/lib/packbits.py) into splash.py, or /tmp/splash_b.epk and
+# /tmp/splash_r.epk. Packed planes are unpacked on the fly when displayed,
+# wrap packed bytes in packbits.PackedPlane first.
+#
+# Sources are modules holding IMAGE_BLACK and IMAGE_RED, or images (needs
+# Pillow): red pixels go to the red plane, dark ones to the black plane.
+
+import argparse
+import os
+import sys
+
+PACKED_MAGIC = b'EPK1'
+
+
+# PackBits: runs of 2 to 128 equal bytes become 257 - count and the byte,
+# other bytes are copied in blocks of up to 128 after count - 1
+def pack(data):
+    packed = bytearray()
+    i = 0
+    while i < len(data):
+        run = 1
+        while i + run < len(data) and run < 128 and data[i + run] == data[i]:
+            run += 1
+        if run > 1:
+            packed += bytes([257 - run, data[i]])
+            i += run
+            continue
+        start = i
+        while i < len(data) and i - start < 128:
+            if i + 2 < len(data) and data[i] == data[i + 1] == data[i + 2]:
+                break
+            i += 1
+        packed.append(i - start - 1)
+        packed += data[start:i]
+    return bytes(packed)
+
+
+def unpack(packed):
+    data = bytearray()
+    i = 0
+    while i < len(packed):
+        n = packed[i]
+        if n < 128:
+            data += packed[i + 1:i + n + 2]
+            i += n + 2
+        elif n > 128:
+            data += bytes([packed[i + 1]]) * (257 - n)
+            i += 2
+        else:
+            i += 1
+    return bytes(data)
+
+
+def pack_plane(plane, width, height):
+    return PACKED_MAGIC + width.to_bytes(2, 'little') + height.to_bytes(2, 'little') + pack(plane)
+
+
+def unpack_plane(data, width, height, path):
+    size = (int.from_bytes(data[4:6], 'little'), int.from_bytes(data[6:8], 'little'))
+    if size != (width, height):
+        raise ValueError('{}: packed plane is {}x{}, expected {}x{}'.format(path, size[0], size[1], width, height))
+    return unpack(data[8:])
+
+
+def read_module(path, width, height):
+    namespace = {'const': lambda value: value}
+    with open(path) as source:
+        exec(compile(source.read(), path, 'exec'), namespace)
+    planes = []
+    for name in ('IMAGE_BLACK', 'IMAGE_RED'):
+        plane = namespace.get(name)
+        if plane is not None:
+            plane = bytes(plane)
+            if plane.startswith(PACKED_MAGIC):
+                plane = unpack_plane(plane, width, height, path)
+            if len(plane) != width * height // 8:
+                raise ValueError('{}: {} is {} bytes, expected {}'.format(path, name, len(plane), width * height // 8))
+        planes.append(plane)
+    return planes
+
+
+def read_image(path, width, height, threshold):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit('images need Pillow: pip install Pillow')
+    image = Image.open(path).convert('RGB')
+    if image.size != (width, height):
+        raise ValueError('{}: image is {}x{}, expected {}x{}'.format(path, image.size[0], image.size[1], width, height))
+    pixels = image.load()
+    black = bytearray(b'\xff' * (width * height // 8))
+    red = bytearray(black)
+    has_red = False
+    for y in range(height):
+        for x in range(width):
+            r, g, b = pixels[x, y]
+            index = (x + y * width) // 8
+            bit = 0x80 >> (x % 8)
+            if r >= threshold and g < threshold and b < threshold:
+                red[index] &= ~bit
+                has_red = True
+            elif (r * 299 + g * 587 + b * 114) // 1000 < threshold:
+                black[index] &= ~bit
+    return [bytes(black), bytes(red) if has_red else None]
+
+
+def write_module(planes, path, source):
+    lines = ['# Generated by tools/frameconv.py from {}'.format(os.path.basename(source))]
+    for name, plane in zip(('IMAGE_BLACK', 'IMAGE_RED'), planes):
+        if plane is not None:
+            lines.append('{} = {!r}'.format(name, plane))
+    with open(path, 'w') as output:
+        output.write('\n'.join(lines) + '\n')
+    return [path]
+
+
+def write_plane_files(planes, prefix, extension):
+    paths = []
+    for suffix, plane in zip(('_b' + extension, '_r' + extension), planes):
+        if plane is not None:
+            with open(prefix + suffix, 'wb') as output:
+                output.write(plane)
+            paths.append(prefix + suffix)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert static screens for the e-Paper library')
+    parser.add_argument('source', help='module holding IMAGE_BLACK and IMAGE_RED (.py), or an image')
+    parser.add_argument('output', help='module to write (.py), or prefix of the plane files to write')
+    parser.add_argument('--width', type=int, default=200, help='panel width')
+    parser.add_argument('--height', type=int, default=200, help='panel height')
+    parser.add_argument('--threshold', type=int, default=128, help='level splitting dark from light, 0-255')
+    parser.add_argument('--packed', action='store_true', help='compress the planes with PackBits')
+    args = parser.parse_args()
+
+    if args.source.lower().endswith('.py'):
+        planes = read_module(args.source, args.width, args.height)
+    else:
+        planes = read_image(args.source, args.width, args.height, args.threshold)
+
+    if args.packed:
+        planes = [None if plane is None else pack_plane(plane, args.width, args.height) for plane in planes]
+
+    if args.output.lower().endswith('.py'):
+        paths = write_module(planes, args.output, args.source)
+    else:
+        paths = write_plane_files(planes, args.output, '.epk' if args.packed else '.bin')
+    for path in paths:
+        print('{}: {} bytes'.format(path, os.path.getsize(path)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# Host stand-in for the Pycom machine module, for running the library under
+# CPython (see tools/bench.py). Pins hold a value, SPI counts what is written.
+
+
+class Pin:
+    IN = 1
+    OUT = 2
+    OPEN_DRAIN = 7
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 1
+    IRQ_RISING = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._mode = mode
+        self._pull = pull
+        self._value = 0 if value is None else int(bool(value))
+        self._handler = None
+
+    def __repr__(self):
+        return "Pin('{}')".format(self.id)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        self._mode = mode
+        self._pull = pull
+        if value is not None:
+            self._value = int(bool(value))
+
+    def mode(self, mode=None):
+        if mode is None:
+            return self._mode
+        self._mode = mode
+
+    def pull(self, pull=None):
+        if pull is None:
+            return self._pull
+        self._pull = pull
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = int(bool(value))
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def toggle(self):
+        self._value ^= 1
+
+    # Pycom interrupt API, handlers are never called on the host
+    def callback(self, trigger, handler=None, arg=None):
+        self._handler = handler
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self._handler = handler
+
+
+class SPI:
+    MASTER = 0
+    MSB = 0
+    LSB = 1
+
+    def __init__(self, id=0, mode=MASTER, baudrate=1000000, polarity=0, phase=0, bits=8, firstbit=MSB, pins=None):
+        self.id = id
+        self.bytes_written = 0
+        self.writes = 0
+        self.init(mode, baudrate, polarity, phase, bits, firstbit, pins)
+
+    def init(self, mode=MASTER, baudrate=1000000, polarity=0, phase=0, bits=8, firstbit=MSB, pins=None):
+        self.mode = mode
+        self.baudrate = baudrate
+        self.polarity = polarity
+        self.phase = phase
+        self.bits = bits
+        self.firstbit = firstbit
+        self.pins = pins
+
+    def deinit(self):
+        pass
+
+    # Pycom's write takes an int for a single byte as well
+    def write(self, data):
+        count = 1 if isinstance(data, int) else len(data)
+        self.bytes_written += count
+        self.writes += 1
+        return count
@@ -0,0 +1,18 @@
+# Host stand-in for the pycom module: the heartbeat and RGB LED do nothing.
+
+_heartbeat = True
+_rgbled = 0
+
+
+def heartbeat(enabled=None):
+    global _heartbeat
+    if enabled is None:
+        return _heartbeat
+    _heartbeat = bool(enabled)
+
+
+def rgbled(color=None):
+    global _rgbled
+    if color is None:
+        return _rgbled
+    _rgbled = color
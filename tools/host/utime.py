@@ -0,0 +1,44 @@
+# Host stand-in for MicroPython's utime. Sleeps return at once, the time
+# that would have been spent sleeping is added up in slept_ms.
+import time as _time
+
+slept_ms = 0
+
+
+def sleep(seconds):
+    global slept_ms
+    slept_ms += seconds * 1000
+
+
+def sleep_ms(ms):
+    global slept_ms
+    slept_ms += ms
+
+
+def sleep_us(us):
+    global slept_ms
+    slept_ms += us / 1000
+
+
+def ticks_ms():
+    return _time.perf_counter_ns() // 1000000
+
+
+def ticks_us():
+    return _time.perf_counter_ns() // 1000
+
+
+def ticks_cpu():
+    return _time.perf_counter_ns()
+
+
+def ticks_add(ticks, delta):
+    return ticks + delta
+
+
+def ticks_diff(ticks1, ticks2):
+    return ticks1 - ticks2
+
+
+def time():
+    return int(_time.time())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# Host-side consistency checks of the shape drawing functions, runs on
+# CPython with the stand-ins in tools/host. Shapes that are meant to line up
+# are drawn into separate buffers and their pixels compared, e.g.
+#   python3 tools/shapecheck.py --count 500 --seed 7
+# Exits with status 1 if any check fails.
+
+import argparse
+import builtins
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_DIR = os.path.join(ROOT, 'tools', 'host')
+LIB_DIR = os.path.join(ROOT, 'epd', 'lib')
+
+sys.path[:0] = [HOST_DIR, LIB_DIR]
+if not hasattr(builtins, 'const'):
+    builtins.const = lambda value: value
+
+from machine import Pin
+import epd1in54b
+from epd1in54b import COLORED
+
+
+def create_epd():
+    busy = Pin('busy', value=1 - epd1in54b.EPD.BUSY_LEVEL)
+    return epd1in54b.EPD(Pin('reset'), Pin('dc'), busy, Pin('cs'), Pin('clk'), Pin('mosi'))
+
+
+# Set of the colored pixels drawn by draw(epd, frame_buffer), in buffer terms
+def pixels(epd, draw):
+    frame_buffer = bytearray(b'\xff' * (epd.WIDTH * epd.HEIGHT // 8))
+    draw(epd, frame_buffer)
+    result = set()
+    for index, byte in enumerate(frame_buffer):
+        if byte != 0xFF:
+            for bit in range(8):
+                if not byte & (0x80 >> bit):
+                    result.add(index * 8 + bit)
+    return result
+
+
+def random_polygon(rng):
+    count = rng.randint(3, 8)
+    return [(rng.randint(-20, 219), rng.randint(-20, 219)) for _ in range(count)]
+
+
+# Every pixel draw_polygon sets is filled by draw_filled_polygon
+def check_polygon_outline(epd, points):
+    outline = pixels(epd, lambda epd, fb: epd.draw_polygon(fb, points, COLORED))
+    fill = pixels(epd, lambda epd, fb: epd.draw_filled_polygon(fb, points, COLORED))
+    missing = len(outline - fill)
+    if missing:
+        return '{} outline pixels outside the fill'.format(missing)
+
+
+def random_circle(rng):
+    return rng.randint(-20, 219), rng.randint(-20, 219), rng.randint(0, 120)
+
+
+def compare(name, drawn, expected):
+    extra = len(drawn - expected)
+    missing = len(expected - drawn)
+    if extra or missing:
+        return '{} {} extra, {} missing'.format(name, extra, missing)
+
+
+# Pies, arcs and ellipses of a whole circle are the circles draw_circle and
+# draw_filled_circle draw, and pies that sweep no angle draw nothing
+def check_circle(epd, circle):
+    x, y, radius = circle
+    outline = pixels(epd, lambda epd, fb: epd.draw_circle(fb, x, y, radius, COLORED))
+    fill = pixels(epd, lambda epd, fb: epd.draw_filled_circle(fb, x, y, radius, COLORED))
+    errors = [
+        compare('pie', pixels(epd, lambda epd, fb: epd.draw_pie(fb, x, y, radius, 0, 360, COLORED)), fill),
+        compare('arc', pixels(epd, lambda epd, fb: epd.draw_arc(fb, x, y, radius, 90, 450, COLORED)), outline),
+        compare('filled ellipse', pixels(epd, lambda epd, fb: epd.draw_filled_ellipse(fb, x, y, radius, radius, COLORED)), fill),
+        compare('ellipse', pixels(epd, lambda epd, fb: epd.draw_ellipse(fb, x, y, radius, radius, COLORED)), outline),
+        compare('empty pie', pixels(epd, lambda epd, fb: epd.draw_pie(fb, x, y, radius, 30, 30, COLORED)), set()),
+    ]
+    errors = [error for error in errors if error]
+    if errors:
+        return ', '.join(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that shapes of the e-Paper library line up')
+    parser.add_argument('--count', type=int, default=100, help='random shapes per check')
+    parser.add_argument('--seed', type=int, default=1, help='random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    epd = create_epd()
+    cases = [('polygon outline in fill', check_polygon_outline, [(10, 100), (190, 110), (100, 130)])]
+    for _ in range(args.count):
+        cases.append(('polygon outline in fill', check_polygon_outline, random_polygon(rng)))
+    for radius in range(0, 8):
+        cases.append(('circle shapes', check_circle, (100, 100, radius)))
+    for _ in range(args.count):
+        cases.append(('circle shapes', check_circle, random_circle(rng)))
+
+    failures = 0
+    for rotate in range(4):
+        epd.set_rotate(rotate)
+        for name, check, shape in cases:
+            error = check(epd, shape)
+            if error:
+                failures += 1
+                print('rot{} {} {!r}: {}'.format(rotate * 90, name, shape, error))
+    print('{} checks, {} failed'.format(4 * len(cases), failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# SPI transaction recorder, runs on CPython with the stand-ins in tools/host.
+# A Recording stands in for the SPI bus and the DC, CS and reset pins of an
+# EPD and logs every pin level and SPI write, whichever driver path they
+# come from (send_command, send_data, send_command_data, bulk plane writes):
+#   recording = Recording()
+#   epd = epd1in54b.EPD(*recording.pins(busy_idle=1), spi=recording.spi)
+#   epd.init()
+#   ...
+#   print(recording.summary().report(baudrate=2000000, call_overhead_us=20))
+# The log decodes into commands with their payloads, and a controller model
+# replays them into the planes the controller ends up holding, to check
+# transfer paths byte for byte:
+#   controller = Controller1in54b(200, 200)
+#   recording.replay(controller)
+#   controller.planes == (expected_black, expected_red)
+#
+# Run as a script, it draws a screen in every rotation, sends it and checks
+# what the controller received against buffers drawn in panel orientation,
+# printing the traffic of every step, e.g.
+#   python3 tools/spirecord.py --driver epd1in54 --logical --baudrate 4000000
+
+import argparse
+import builtins
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_DIR = os.path.join(ROOT, 'tools', 'host')
+LIB_DIR = os.path.join(ROOT, 'epd', 'lib')
+FROZEN_DIR = os.path.join(ROOT, 'frozen')
+
+sys.path[:0] = [HOST_DIR, LIB_DIR, FROZEN_DIR]
+if not hasattr(builtins, 'const'):
+    builtins.const = lambda value: value
+
+from machine import Pin
+
+# Log entries: (PIN, name, level) for every pin write, (WRITE, dc, cs, data)
+# for every SPI write
+PIN = 'pin'
+WRITE = 'write'
+
+
+class RecordingPin(Pin):
+    def __init__(self, name, recording, value=1):
+        super().__init__(name, value=value)
+        self.recording = recording
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = int(bool(value))
+        self.recording.log.append((PIN, self.id, self._value))
+
+
+class RecordingSPI:
+    MASTER = 0
+
+    def __init__(self, recording):
+        self.recording = recording
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def deinit(self):
+        pass
+
+    def write(self, data):
+        data = bytes([data]) if isinstance(data, int) else bytes(data)
+        recording = self.recording
+        recording.log.append((WRITE, recording.dc(), recording.cs(), data))
+        return len(data)
+
+
+class Recording:
+    def __init__(self):
+        self.log = []
+        self.reset_pin = RecordingPin('reset', self)
+        self.dc_pin = RecordingPin('dc', self)
+        self.cs_pin = RecordingPin('cs', self)
+        self.spi = RecordingSPI(self)
+
+    def dc(self):
+        return self.dc_pin._value
+
+    def cs(self):
+        return self.cs_pin._value
+
+    # Constructor arguments of an EPD: reset, dc, busy, cs, clk and mosi.
+    # The busy pin stays at busy_idle, so that the EPD never waits.
+    def pins(self, busy_idle):
+        return (self.reset_pin, self.dc_pin, Pin('busy', value=busy_idle), self.cs_pin,
+                Pin('clk'), Pin('mosi'))
+
+    # Position in the log, to summarise or decode from there on
+    def mark(self):
+        return len(self.log)
+
+    def clear(self):
+        del self.log[:]
+
+    def summary(self, start=0, end=None):
+        return Summary(self.log[start:end], self.levels(start))
+
+    # Pin levels by name at a position in the log, all pins start high
+    def levels(self, position):
+        levels = {'reset': 1, 'dc': 1, 'cs': 1}
+        for entry in self.log[:position]:
+            if entry[0] == PIN:
+                levels[entry[1]] = entry[2]
+        return levels
+
+    # Yields (command, payload) as the controller sees them: bytes written
+    # with DC low are commands, bytes written with DC high add to the
+    # payload of the last command, across CS toggles. Writes with CS high
+    # don't reach the controller and are skipped.
+    def commands(self, start=0, end=None):
+        command = None
+        payload = bytearray()
+        for entry in self.log[start:end]:
+            if entry[0] != WRITE or entry[2]:
+                continue
+            dc, data = entry[1], entry[3]
+            if dc:
+                if command is not None:
+                    payload += data
+                continue
+            for byte in data:
+                if command is not None:
+                    yield command, bytes(payload)
+                command = byte
+                payload = bytearray()
+        if command is not None:
+            yield command, bytes(payload)
+
+    def replay(self, controller, start=0, end=None):
+        for command, payload in self.commands(start, end):
+            controller.command(command, payload)
+        return controller
+
+    # Lines describing the log from start on, commands named after the
+    # constants of module when given
+    def dump(self, start=0, end=None, module=None):
+        names = command_names(module) if module is not None else {}
+        lines = []
+        for command, payload in self.commands(start, end):
+            name = names.get(command, '')
+            if len(payload) <= 16:
+                lines.append('0x{:02X} {:<36} {}'.format(command, name, payload.hex(' ')))
+            else:
+                lines.append('0x{:02X} {:<36} {} bytes: {} ...'.format(command, name, len(payload), payload[:16].hex(' ')))
+        return lines
+
+
+class Summary:
+    def __init__(self, log, levels):
+        # CS low periods, SPI write calls, bytes written with DC low and high
+        self.transactions = 0
+        self.writes = 0
+        self.command_bytes = 0
+        self.data_bytes = 0
+        # writes while CS is high, which the controller ignores
+        self.stray_writes = 0
+        # pin write calls, and writes that changed the level, by pin name
+        self.pin_writes = {}
+        self.toggles = {}
+        levels = dict(levels)
+        for entry in log:
+            if entry[0] == PIN:
+                name, level = entry[1], entry[2]
+                self.pin_writes[name] = self.pin_writes.get(name, 0) + 1
+                if levels.get(name) != level:
+                    self.toggles[name] = self.toggles.get(name, 0) + 1
+                    if name == 'cs' and level == 0:
+                        self.transactions += 1
+                levels[name] = level
+                continue
+            self.writes += 1
+            if entry[2]:
+                self.stray_writes += 1
+            elif entry[1]:
+                self.data_bytes += len(entry[3])
+            else:
+                self.command_bytes += len(entry[3])
+
+    @property
+    def bytes(self):
+        return self.command_bytes + self.data_bytes
+
+    # Estimated time on the bus: bytes clocked out at baudrate, plus
+    # call_overhead_us for every SPI write and pin write
+    def bus_time_us(self, baudrate, call_overhead_us=0):
+        calls = self.writes + sum(self.pin_writes.values())
+        return self.bytes * 8 * 1000000 // baudrate + calls * call_overhead_us
+
+    def as_dict(self, baudrate=None, call_overhead_us=0):
+        result = {
+            'transactions': self.transactions,
+            'writes': self.writes,
+            'command_bytes': self.command_bytes,
+            'data_bytes': self.data_bytes,
+            'stray_writes': self.stray_writes,
+            'pin_writes': dict(self.pin_writes),
+            'toggles': dict(self.toggles),
+        }
+        if baudrate:
+            result['bus_time_us'] = self.bus_time_us(baudrate, call_overhead_us)
+        return result
+
+    def report(self, baudrate=2000000, call_overhead_us=0):
+        return '{:>5} transactions {:>6} writes {:>4} commands {:>6} data bytes {:>5} dc {:>5} cs toggles {:>8} us'.format(
+            self.transactions, self.writes, self.command_bytes, self.data_bytes,
+            self.toggles.get('dc', 0), self.toggles.get('cs', 0), self.bus_time_us(baudrate, call_overhead_us))
+
+
+# Command byte: constant name, from the uppercase constants a driver module
+# defines itself
+def command_names(module):
+    import drawing
+    import epdbase
+    shared = set(dir(drawing)) | set(dir(epdbase))
+    names = {}
+    for name in dir(module):
+        value = getattr(module, name)
+        if (name.isupper() and name not in shared and not name.startswith(('EPD_', 'CHUNK'))
+                and isinstance(value, int) and 0 <= value < 256):
+            names.setdefault(value, name)
+    return names
+
+
+# 1.54" (B) controller: DATA_START_TRANSMISSION_1 (0x10) receives the black
+# plane at 2 bits per pixel, DATA_START_TRANSMISSION_2 (0x13) the red plane
+# at 1 bit per pixel. Pixels of the black plane sent as 11 decode to 1
+# (white), 00 to 0, other pairs count as bad_pixels and decode to 0.
+class Controller1in54b:
+    DATA_START_TRANSMISSION_1 = 0x10
+    DATA_START_TRANSMISSION_2 = 0x13
+
+    def __init__(self, width, height):
+        self.size = width * height // 8
+        self.black = bytearray(b'\xff' * self.size)
+        self.red = bytearray(b'\xff' * self.size)
+        self.registers = {}
+        self.bad_pixels = 0
+        # bytes past the end of a plane
+        self.overflow = 0
+
+    @property
+    def planes(self):
+        return (bytes(self.black), bytes(self.red))
+
+    def command(self, command, payload):
+        if command == self.DATA_START_TRANSMISSION_1:
+            self._black_plane(payload)
+        elif command == self.DATA_START_TRANSMISSION_2:
+            self.overflow += max(0, len(payload) - self.size)
+            self.red[:min(len(payload), self.size)] = payload[:self.size]
+        else:
+            self.registers[command] = payload
+
+    def _black_plane(self, payload):
+        black = self.black
+        for pos in range(0, len(payload) - 1, 2):
+            index = pos >> 1
+            if index >= self.size:
+                self.overflow += len(payload) - pos
+                break
+            byte = 0
+            pixels = (payload[pos] << 8) | payload[pos + 1]
+            for bit in range(8):
+                pair = (pixels >> (14 - 2 * bit)) & 3
+                if pair == 3:
+                    byte |= 0x80 >> bit
+                elif pair:
+                    self.bad_pixels += 1
+            black[index] = byte
+
+
+# 1.54" controller: WRITE_RAM (0x24) writes bytes of 8 pixels from the RAM
+# address counters (0x4E, 0x4F), X first, within the window set with 0x44
+# and 0x45. Only the X and Y increment data entry mode (0x11 0x03) is
+# modelled. The controller switches between its two RAM banks on every
+# MASTER_ACTIVATION (0x20): planes holds both, bank the one written to.
+class Controller1in54:
+    DATA_ENTRY_MODE_SETTING = 0x11
+    MASTER_ACTIVATION = 0x20
+    WRITE_RAM = 0x24
+    SET_RAM_X_ADDRESS_START_END_POSITION = 0x44
+    SET_RAM_Y_ADDRESS_START_END_POSITION = 0x45
+    SET_RAM_X_ADDRESS_COUNTER = 0x4E
+    SET_RAM_Y_ADDRESS_COUNTER = 0x4F
+
+    def __init__(self, width, height):
+        self.stride = width // 8
+        self.height = height
+        size = self.stride * height
+        self.banks = [bytearray(b'\xff' * size), bytearray(b'\xff' * size)]
+        self.bank = 0
+        self.registers = {}
+        self.x_start = 0
+        self.x_end = self.stride - 1
+        self.y_start = 0
+        self.y_end = height - 1
+        self.x = 0
+        self.y = 0
+        # writes in a data entry mode that isn't modelled
+        self.unsupported = 0
+
+    @property
+    def planes(self):
+        return (bytes(self.banks[0]), bytes(self.banks[1]))
+
+    def command(self, command, payload):
+        if command == self.SET_RAM_X_ADDRESS_START_END_POSITION:
+            self.x_start = payload[0]
+            self.x_end = payload[1]
+        elif command == self.SET_RAM_Y_ADDRESS_START_END_POSITION:
+            self.y_start = payload[0] | (payload[1] << 8)
+            self.y_end = payload[2] | (payload[3] << 8)
+        elif command == self.SET_RAM_X_ADDRESS_COUNTER:
+            self.x = payload[0]
+        elif command == self.SET_RAM_Y_ADDRESS_COUNTER:
+            self.y = payload[0] | (payload[1] << 8)
+        elif command == self.WRITE_RAM:
+            self._write_ram(payload)
+        elif command == self.MASTER_ACTIVATION:
+            self.bank ^= 1
+        else:
+            self.registers[command] = payload
+
+    def _write_ram(self, payload):
+        if self.registers.get(self.DATA_ENTRY_MODE_SETTING, b'\x03') != b'\x03':
+            self.unsupported += len(payload)
+            return
+        ram = self.banks[self.bank]
+        for byte in payload:
+            if self.x < self.stride and self.y < self.height:
+                ram[self.y * self.stride + self.x] = byte
+            self.x += 1
+            if self.x > self.x_end:
+                self.x = self.x_start
+                self.y += 1
+                if self.y > self.y_end:
+                    self.y = self.y_start
+
+
+CONTROLLERS = {
+    'epd1in54b': Controller1in54b,
+    'epd1in54': Controller1in54,
+}
+
+
+# Draws the same screen into buffers of the current layout and orientation.
+# Variants after the first only redraw the value at the bottom.
+def draw_screen(epd, module, frame_buffer_black, frame_buffer_red, variant=0):
+    import font12
+    import font20
+    colored = module.COLORED
+    if variant:
+        epd.draw_filled_rectangle(frame_buffer_black, 12, 188, 199, 199, module.UNCOLORED)
+        epd.display_string_at(frame_buffer_black, 12, 188, 'value: {}'.format(variant), font12, colored)
+        return
+    epd.clear_frame(frame_buffer_black, frame_buffer_red)
+    epd.draw_rectangle(frame_buffer_black, 10, 60, 50, 110, colored)
+    epd.draw_line(frame_buffer_black, 10, 60, 50, 110, colored)
+    epd.draw_line(frame_buffer_black, 50, 60, 10, 110, colored)
+    epd.draw_circle(frame_buffer_black, 120, 80, 30, colored)
+    epd.draw_filled_rectangle(frame_buffer_red, 10, 130, 50, 180, colored)
+    epd.draw_filled_circle(frame_buffer_red, 120, 150, 30, colored)
+    epd.display_string_at(frame_buffer_black, 20, 30, 'Hello Pycom!', font20, colored)
+    epd.display_string_at(frame_buffer_black, 12, 188, 'value: {}'.format(variant), font12, colored)
+
+
+def run(args):
+    import importlib
+    module = importlib.import_module(args.driver)
+    recording = Recording()
+    epd = module.EPD(*recording.pins(busy_idle=1 - module.EPD.BUSY_LEVEL), spi=recording.spi)
+    epd.set_logical_buffers(args.logical)
+    # draws the reference buffers in panel orientation
+    reference = module.EPD(Pin('reset'), Pin('dc'), Pin('busy'), Pin('cs'), Pin('clk'), Pin('mosi'))
+    size = epd.WIDTH * epd.HEIGHT // 8
+    black = bytearray(size)
+    red = bytearray(size)
+    expected_black = bytearray(size)
+    expected_red = bytearray(size)
+    failures = 0
+
+    def step(name, start):
+        print('{:<28} {}'.format(name, recording.summary(start).report(args.baudrate, args.overhead_us)))
+        if args.dump:
+            for line in recording.dump(start, module=module):
+                print('    ' + line)
+
+    start = recording.mark()
+    epd.init()
+    step('init', start)
+    for rotate in range(4):
+        for variant in range(2):
+            reference.set_rotate(rotate)
+            draw_screen(reference, module, expected_black, expected_red, variant)
+            if epd.rotate != rotate:
+                epd.set_rotate(rotate)
+            draw_screen(epd, module, black, red, variant)
+            if variant and hasattr(module, 'PARTIAL_REFRESH'):
+                epd.set_refresh_mode(module.PARTIAL_REFRESH)
+            start = recording.mark()
+            epd.display_frame(black, red)
+            step('display_frame rot{} #{}'.format(rotate * 90, variant), start)
+            epd.set_refresh_mode(module.FULL_REFRESH)
+            controller = recording.replay(CONTROLLERS[args.driver](epd.WIDTH, epd.HEIGHT))
+            expected = (bytes(expected_black), bytes(expected_red) if epd.has_red_plane else bytes(expected_black))
+            for name, plane, buffer in zip(('plane 0', 'plane 1'), controller.planes, expected):
+                if plane != buffer:
+                    offset = next(i for i in range(size) if plane[i] != buffer[i])
+                    print('  {} differs from byte {}: 0x{:02X}, expected 0x{:02X}'.format(name, offset, plane[offset], buffer[offset]))
+                    failures += 1
+    start = recording.mark()
+    epd.sleep()
+    step('sleep', start)
+    print('{:<28} {}'.format('total', recording.summary().report(args.baudrate, args.overhead_us)))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record and check the SPI traffic of the e-Paper library')
+    parser.add_argument('--driver', default='epd1in54b', choices=sorted(CONTROLLERS), help='driver module')
+    parser.add_argument('--logical', action='store_true', help='use buffers in logical orientation')
+    parser.add_argument('--baudrate', type=int, default=2000000, help='SPI clock, for the bus time estimate')
+    parser.add_argument('--overhead-us', type=int, default=0, help='estimated cost of every SPI and pin write call, in us')
+    parser.add_argument('--dump', action='store_true', help='print every command and its payload')
+    args = parser.parse_args()
+    failures = run(args)
+    if failures:
+        print('{} planes differ from the buffers'.format(failures))
+        return 1
+    print('controller planes match the buffers')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())